@@ -0,0 +1,131 @@
+"""Bulk list bodies validated in one call versus chunked in a process pool.
+
+Run with ``python -m benchmarks.bench_bulk [--items N] [--workers N]``.
+
+The parent process still unpickles every validated item, which costs about
+as much as validating a plain model. The process pool pays off for models
+whose validation is heavy (Python validators, large nested items) and on
+machines with several cores; the ``heavy`` cases show that regime. The routes
+set ``bulk_min_bytes=0`` so that every body goes through the pool. The
+``split`` cases time finding the chunk boundaries in the parent process alone.
+"""
+
+import argparse
+import hashlib
+import json
+from concurrent.futures import ProcessPoolExecutor
+from typing import Annotated, Any, Dict, List
+
+from flask import Flask
+from pydantic import BaseModel, field_validator
+
+from benchmarks.common import WSGICall, measure, print_result, write_results
+from flask_request_data_validator import Body, parameter_validator, set_bulk_executor
+from flask_request_data_validator.bulk import split_json_array
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+    tags: List[str] = []
+
+
+class HeavyItem(Item):
+    @field_validator("name")
+    @classmethod
+    def check_name(cls, value: str) -> str:
+        digest = value.encode()
+        for _ in range(50):
+            digest = hashlib.sha256(digest).digest()
+        return value
+
+
+app = Flask(__name__)
+
+
+@app.post("/light/single")
+@parameter_validator
+def light_single(items: List[Item]):
+    return "ok"
+
+
+@app.post("/light/bulk")
+@parameter_validator
+def light_bulk(
+    items: Annotated[List[Item], Body(bulk_chunk_size=5000, bulk_min_bytes=0)],
+):
+    return "ok"
+
+
+@app.post("/heavy/single")
+@parameter_validator
+def heavy_single(items: List[HeavyItem]):
+    return "ok"
+
+
+@app.post("/heavy/bulk")
+@parameter_validator
+def heavy_bulk(
+    items: Annotated[List[HeavyItem], Body(bulk_chunk_size=5000, bulk_min_bytes=0)],
+):
+    return "ok"
+
+
+def body(count: int) -> bytes:
+    items = [
+        {"name": f"item-{index}", "price": index, "tags": ["a", "b"]}
+        for index in range(count)
+    ]
+    return json.dumps(items).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, action="append")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--min-time", type=float, default=0.5)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    executor = ProcessPoolExecutor(max_workers=args.workers)
+    set_bulk_executor(executor)
+    results: List[Dict[str, Any]] = []
+    try:
+        for count in args.items or [10_000, 50_000]:
+            data = body(count)
+            result = {
+                "name": f"split/{count}",
+                **measure(
+                    lambda: split_json_array(data, 5000), min_time=args.min_time
+                ),
+            }
+            print_result(result)
+            results.append(result)
+            for path in (
+                "/light/single",
+                "/light/bulk",
+                "/heavy/single",
+                "/heavy/bulk",
+            ):
+                call = WSGICall(
+                    app,
+                    path=path,
+                    method="POST",
+                    data=data,
+                    content_type="application/json",
+                )
+                call()
+                result = {
+                    "name": f"{path.strip('/')}/{count}",
+                    **measure(call, min_time=args.min_time),
+                }
+                print_result(result)
+                results.append(result)
+    finally:
+        executor.shutdown()
+    if args.output:
+        write_results(args.output, "bulk", results)
+
+
+if __name__ == "__main__":
+    main()
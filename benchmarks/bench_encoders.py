@@ -0,0 +1,65 @@
+"""JSON encoder backends on large error lists and validated models.
+
+Run with ``python -m benchmarks.bench_encoders [--output results.json]``.
+"""
+
+import argparse
+from typing import Any, Dict, List
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from benchmarks.common import measure, print_result, write_results
+from flask_request_data_validator.encoders import json_encoders
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+    tags: List[str] = []
+
+
+def error_list(count: int) -> Dict[str, Any]:
+    adapter = TypeAdapter(List[Item])
+    try:
+        adapter.validate_python(
+            [{"name": index, "price": "x"} for index in range(count)]
+        )
+    except ValidationError as e:
+        return {"detail": e.errors()}
+    raise AssertionError("expected validation errors")
+
+
+def model_list(count: int) -> List[Item]:
+    return [
+        Item(name=f"item-{index}", price=index, tags=["a", "b"])
+        for index in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, action="append")
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    results: List[Dict[str, Any]] = []
+    for count in args.count or [100, 1_000, 10_000]:
+        payloads: Dict[str, Any] = {
+            "errors": error_list(count),
+            "models": model_list(count),
+        }
+        for payload_name, payload in payloads.items():
+            for encoder_name, encoder in json_encoders.items():
+                result = {
+                    "name": f"{payload_name}/{count}/{encoder_name}",
+                    **measure(lambda: encoder(payload), min_time=args.min_time),
+                }
+                print_result(result)
+                results.append(result)
+    if args.output:
+        write_results(args.output, "encoders", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Cost of the 422 path when a client leaves out many required fields.
+
+Run with ``python -m benchmarks.bench_errors [--fields N]``. Each case is
+timed on a valid request and on one that omits every field, next to the
+cost of building the same errors with ``ValidationError.from_exception_data``.
+"""
+
+import argparse
+import inspect
+from typing import Annotated, Any, Callable, Dict, List
+
+from flask import Flask
+from pydantic import BaseModel, ValidationError, create_model
+
+from benchmarks.common import WSGICall, measure, print_result, write_results
+from flask_request_data_validator import Query, parameter_validator
+
+
+def make_app(fields: int) -> Flask:
+    app = Flask(__name__)
+    names = [f"field_{index}" for index in range(fields)]
+
+    def query_view(**kwargs: Any) -> str:
+        return "ok"
+
+    query_view.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+        [
+            inspect.Parameter(
+                name, inspect.Parameter.KEYWORD_ONLY, annotation=Annotated[int, Query()]
+            )
+            for name in names
+        ]
+    )
+    app.get("/query")(parameter_validator(query_view))
+
+    model: type[BaseModel] = create_model(  # type: ignore[call-overload]
+        "Item", **{name: (int, ...) for name in names}
+    )
+
+    def body_view(item: model) -> str:  # type: ignore[valid-type]
+        return "ok"
+
+    app.post("/json")(parameter_validator(body_view))
+    return app
+
+
+def from_exception_data(fields: int) -> Callable[[], None]:
+    locs = [("query", f"field_{index}") for index in range(fields)]
+
+    def run() -> None:
+        for loc in locs:
+            ValidationError.from_exception_data(
+                "Field required", [{"type": "missing", "loc": loc, "input": None}]
+            ).errors()
+
+    return run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fields", type=int, action="append")
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    results: List[Dict[str, Any]] = []
+    for fields in args.fields or [1, 10, 50]:
+        app = make_app(fields)
+        values = {f"field_{index}": "1" for index in range(fields)}
+        cases: Dict[str, Callable[[], None]] = {
+            f"query/valid/{fields}": WSGICall(
+                app, path="/query", method="GET", query_string=values
+            ),
+            f"query/missing/{fields}": WSGICall(app, path="/query", method="GET"),
+            f"json/valid/{fields}": WSGICall(
+                app, path="/json", method="POST", json=values
+            ),
+            f"json/missing/{fields}": WSGICall(
+                app, path="/json", method="POST", json={}
+            ),
+            f"from_exception_data/{fields}": from_exception_data(fields),
+        }
+        for name, call in cases.items():
+            result = {"name": name, **measure(call, min_time=args.min_time)}
+            print_result(result)
+            results.append(result)
+    if args.output:
+        write_results(args.output, "errors", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""MessagePack request bodies and responses compared with JSON.
+
+Run with ``python -m benchmarks.bench_msgpack [--items N] [--output results.json]``.
+
+Requires the ``msgpack`` package. ``request/...`` cases post a list of models
+and validate it; ``response/...`` cases return the same list through a
+``response_model``. MessagePack payloads are about a third smaller than
+JSON, but JSON bodies use the ``validate_json`` fast path while MessagePack
+bodies are decoded to Python objects first, so the gain is on the wire
+rather than in CPU time.
+"""
+
+import argparse
+import json
+from typing import Annotated, Any, Dict, List
+
+import msgpack
+from flask import Flask
+from pydantic import BaseModel
+
+from benchmarks.common import WSGICall, measure, print_result, write_results
+from flask_request_data_validator import Path, parameter_validator
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+    tags: List[str] = []
+    attributes: Dict[str, int] = {}
+
+
+app = Flask(__name__)
+ITEMS: Dict[int, List[Dict[str, Any]]] = {}
+
+
+@app.post("/items")
+@parameter_validator(msgpack=True)
+def create_items(items: List[Item]):
+    return "ok"
+
+
+@app.get("/items/<int:count>")
+@parameter_validator(response_model=List[Item], msgpack=True)
+def read_items(count: Annotated[int, Path()]):
+    return ITEMS[count]
+
+
+def items(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "name": f"item-{index}",
+            "price": index * 1.5,
+            "tags": ["a", "b", "c"],
+            "attributes": {"width": index, "height": index * 2},
+        }
+        for index in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, action="append")
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    results: List[Dict[str, Any]] = []
+    for count in args.items or [1, 10, 100, 1_000, 10_000]:
+        payload = ITEMS[count] = items(count)
+        bodies = {
+            "application/json": json.dumps(payload).encode(),
+            "application/msgpack": msgpack.packb(payload),
+        }
+        for media_type, data in bodies.items():
+            calls = {
+                "request": WSGICall(
+                    app,
+                    path="/items",
+                    method="POST",
+                    data=data,
+                    content_type=media_type,
+                ),
+                "response": WSGICall(
+                    app, path=f"/items/{count}", headers={"accept": media_type}
+                ),
+            }
+            for case, call in calls.items():
+                call()
+                assert call.status.startswith("200"), call.status
+                result = {
+                    "name": f"{case}/{count}/{media_type.split('/')[1]}",
+                    "bytes": len(data),
+                    **measure(call, min_time=args.min_time),
+                }
+                print_result(result)
+                results.append(result)
+    if args.output:
+        write_results(args.output, "msgpack", results)
+
+
+if __name__ == "__main__":
+    main()
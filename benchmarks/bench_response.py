@@ -0,0 +1,79 @@
+"""Validated and unsampled response_model serialization of large lists.
+
+Run with ``python -m benchmarks.bench_response [--output results.json]``.
+Unsampled responses (``response_validation_rate`` below 1) skip validation
+only when the view returns model instances. pydantic does not revalidate
+instances either, so both payloads cost about the same sampled or not; the
+``dicts`` cases show what validating plain data costs on top of dumping it.
+"""
+
+import argparse
+from typing import Any, Dict, List
+
+from pydantic import BaseModel
+
+from benchmarks.common import measure, print_result, write_results
+from flask_request_data_validator.response_model import ResponseModel
+
+
+class Owner(BaseModel):
+    name: str
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+    tags: List[str] = []
+    owners: List[Owner] = []
+
+
+def dict_list(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "name": f"item-{index}",
+            "price": index,
+            "tags": ["a", "b"],
+            "owners": [{"name": "owner", "password": "pw"}],
+            "secret": "pw",
+        }
+        for index in range(count)
+    ]
+
+
+def model_list(count: int) -> List[Item]:
+    return [Item.model_validate(item) for item in dict_list(count)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, action="append")
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    response_model = ResponseModel(List[Item])
+    response_model.type_adapter
+    results: List[Dict[str, Any]] = []
+    for count in args.count or [100, 1_000, 10_000]:
+        payloads: Dict[str, Any] = {
+            "dicts": dict_list(count),
+            "models": model_list(count),
+        }
+        for payload_name, payload in payloads.items():
+            cases = {
+                "validated": lambda: response_model.serialize(payload),
+                "unsampled": lambda: response_model.serialize_sampled(payload, 0.0),
+            }
+            for case_name, case in cases.items():
+                result = {
+                    "name": f"{payload_name}/{count}/{case_name}",
+                    **measure(case, min_time=args.min_time),
+                }
+                print_result(result)
+                results.append(result)
+    if args.output:
+        write_results(args.output, "response", results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Decoration and warm-up cost of a few hundred views.
+
+Run with ``python -m benchmarks.bench_startup [--views N]``.
+"""
+
+import argparse
+import time
+from typing import Annotated, Any, Callable, List, Optional
+
+from pydantic import BaseModel
+
+from flask_request_data_validator import (
+    Body,
+    Header,
+    Path,
+    Query,
+    parameter_validator,
+    type_adapter_registry,
+)
+from flask_request_data_validator.validator import ParameterValidator
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+    tags: List[str] = []
+
+
+def make_view(index: int) -> Callable[..., Any]:
+    # Distinct constraints per view keep the registry from sharing adapters,
+    # so every field pays for its own build.
+    def view(
+        item_id: Annotated[int, Path(ge=index)],
+        q: Annotated[Optional[str], Query(max_length=index + 1)] = None,
+        page: Annotated[int, Query(ge=1, le=index + 1)] = 1,
+        x_token: Annotated[str, Header(min_length=index % 7)] = "",
+        item: Annotated[Item, Body(embed=True)] = None,
+        note: Annotated[str, Body(max_length=index + 1)] = "",
+    ) -> None:
+        return None
+
+    view.__name__ = f"view_{index}"
+    return view
+
+
+def run(views: int) -> None:
+    type_adapter_registry.clear()
+    functions = [make_view(index) for index in range(views)]
+
+    start = time.perf_counter()
+    validators: List[ParameterValidator] = [
+        parameter_validator(function) for function in functions
+    ]
+    decorated = time.perf_counter() - start
+    built_on_decoration = type_adapter_registry.info().misses
+
+    start = time.perf_counter()
+    for validator in validators:
+        validator.warmup()
+    warmed = time.perf_counter() - start
+    info = type_adapter_registry.info()
+
+    fields = sum(len(validator.dependant.plans) for validator in validators)
+    print(f"views:                     {views}")
+    print(f"fields:                    {fields}")
+    print(f"adapters built (decorate): {built_on_decoration}")
+    print(f"adapters built (total):    {info.misses}")
+    print(f"adapter builds per field:  {info.misses / fields:.2f}")
+    print(f"decorate:                  {decorated * 1000:.1f} ms")
+    print(f"warm-up:                   {warmed * 1000:.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--views", type=int, default=300)
+    args = parser.parse_args()
+    run(args.views)
+
+
+if __name__ == "__main__":
+    main()
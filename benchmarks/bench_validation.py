@@ -0,0 +1,209 @@
+"""Request validation hot path, per source, outcome and payload size.
+
+Run with ``python -m benchmarks.bench_validation [--output results.json]``.
+Pass ``--compare`` with an earlier output file to print the change per case.
+"""
+
+import argparse
+import io
+import json
+from typing import Annotated, Any, Callable, Dict, Iterator, List, Tuple
+
+from flask import Flask
+from pydantic import BaseModel
+from werkzeug.datastructures import FileStorage
+
+from benchmarks.common import (
+    SIZES,
+    WSGICall,
+    compare_results,
+    measure,
+    print_result,
+    write_results,
+)
+from flask_request_data_validator import (
+    Cookie,
+    File,
+    Form,
+    Header,
+    Path,
+    Query,
+    parameter_validator,
+)
+
+OUTCOMES = ("valid", "invalid", "missing")
+SCALAR_SIZES = [100, 1_000]
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+    tags: List[str] = []
+
+
+app = Flask(__name__)
+
+
+@app.get("/path/<item_id>/<name>")
+@parameter_validator
+def path_view(item_id: Annotated[int, Path()], name: Annotated[str, Path()]):
+    return "ok"
+
+
+@app.get("/query")
+@parameter_validator
+def query_view(item_id: Annotated[int, Query()], name: Annotated[str, Query()]):
+    return "ok"
+
+
+@app.get("/header")
+@parameter_validator
+def header_view(x_item_id: Annotated[int, Header()], x_name: Annotated[str, Header()]):
+    return "ok"
+
+
+@app.get("/cookie")
+@parameter_validator
+def cookie_view(item_id: Annotated[int, Cookie()], name: Annotated[str, Cookie()]):
+    return "ok"
+
+
+@app.post("/json")
+@parameter_validator
+def json_view(item: Item):
+    return "ok"
+
+
+@app.post("/form")
+@parameter_validator
+def form_view(item_id: Annotated[int, Form()], name: Annotated[str, Form()]):
+    return "ok"
+
+
+@app.post("/file")
+@parameter_validator
+def file_view(file: Annotated[FileStorage, File()]):
+    return "ok"
+
+
+def _scalar_values(outcome: str, size: int) -> Dict[str, str]:
+    values = {"item_id": "1", "name": "n" * max(size - 1, 1)}
+    if outcome == "invalid":
+        values["item_id"] = "x"
+    elif outcome == "missing":
+        del values["item_id"]
+    return values
+
+
+def _json_body(outcome: str, size: int) -> bytes:
+    tag_count = max(size // 12, 1)
+    item: Dict[str, Any] = {
+        "name": "Foo",
+        "price": 1.5,
+        "tags": ["tag-%05d" % (i % 100000) for i in range(tag_count)],
+    }
+    if outcome == "invalid":
+        item["price"] = "x"
+    elif outcome == "missing":
+        del item["name"]
+    return json.dumps(item).encode()
+
+
+def request_kwargs(source: str, outcome: str, size: int) -> Dict[str, Any]:
+    if source == "path":
+        values = _scalar_values("valid", size)
+        item_id = "x" if outcome == "invalid" else values["item_id"]
+        if outcome == "missing":
+            return {"path": f"/path/{item_id}/", "method": "GET"}
+        return {"path": f"/path/{item_id}/{values['name']}", "method": "GET"}
+    values = _scalar_values(outcome, size)
+    if source == "query":
+        return {"path": "/query", "method": "GET", "query_string": values}
+    if source == "header":
+        headers = {f"x-{key.replace('_', '-')}": value for key, value in values.items()}
+        return {"path": "/header", "method": "GET", "headers": headers}
+    if source == "cookie":
+        cookie = "; ".join(f"{key}={value}" for key, value in values.items())
+        return {"path": "/cookie", "method": "GET", "headers": {"Cookie": cookie}}
+    if source == "json":
+        return {
+            "path": "/json",
+            "method": "POST",
+            "data": _json_body(outcome, size),
+            "content_type": "application/json",
+        }
+    if source == "form":
+        return {"path": "/form", "method": "POST", "data": values}
+    if source == "file":
+        data: Dict[str, Any] = {}
+        if outcome == "valid":
+            data["file"] = (io.BytesIO(b"f" * size), "file.bin")
+        elif outcome == "invalid":
+            data["file"] = "f" * size
+        return {"path": "/file", "method": "POST", "data": data}
+    raise ValueError(source)
+
+
+SOURCES: Dict[str, List[int]] = {
+    "path": SCALAR_SIZES,
+    "query": SCALAR_SIZES,
+    "header": SCALAR_SIZES,
+    "cookie": SCALAR_SIZES,
+    "json": SIZES,
+    "form": SIZES,
+    "file": SIZES,
+}
+
+
+def _client_call(kwargs: Dict[str, Any]) -> Callable[[], None]:
+    client = app.test_client()
+    call = WSGICall(app, **kwargs)
+
+    def run() -> None:
+        client.open(call.make_environ()).close()
+
+    return run
+
+
+def cases(
+    sources: List[str], drivers: List[str], max_size: int
+) -> Iterator[Tuple[str, Callable[[], None]]]:
+    for source in sources:
+        for size in SOURCES[source]:
+            if size > max_size:
+                continue
+            for outcome in OUTCOMES:
+                for driver in drivers:
+                    kwargs = request_kwargs(source, outcome, size)
+                    name = f"{driver}/{source}/{outcome}/{size}"
+                    if driver == "wsgi":
+                        yield name, WSGICall(app, **kwargs)
+                    else:
+                        yield name, _client_call(kwargs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--source", action="append", choices=list(SOURCES))
+    parser.add_argument("--driver", action="append", choices=["client", "wsgi"])
+    parser.add_argument("--max-size", type=int, default=SIZES[-1])
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--output")
+    parser.add_argument("--compare")
+    args = parser.parse_args()
+
+    results = []
+    for name, call in cases(
+        args.source or list(SOURCES), args.driver or ["client", "wsgi"], args.max_size
+    ):
+        result = {"name": name, **measure(call, min_time=args.min_time)}
+        print_result(result)
+        results.append(result)
+    if args.output:
+        write_results(args.output, "validation", results)
+    if args.compare:
+        compare_results(args.compare, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import io
+import json
+import platform
+import statistics
+import time
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Callable, Dict, List, Optional
+
+from werkzeug.test import EnvironBuilder
+
+SIZES = [100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+
+def measure(
+    func: Callable[[], Any], *, min_time: float = 0.2, min_rounds: int = 3
+) -> Dict[str, float]:
+    timings: List[float] = []
+    deadline = time.perf_counter() + min_time
+    while len(timings) < min_rounds or time.perf_counter() < deadline:
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return {
+        "rounds": len(timings),
+        "min_us": timings[0] * 1e6,
+        "median_us": statistics.median(timings) * 1e6,
+        "p99_us": timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1e6,
+    }
+
+
+class WSGICall:
+    def __init__(self, app: Any, **kwargs: Any) -> None:
+        builder = EnvironBuilder(**kwargs)
+        try:
+            self._environ = builder.get_environ()
+        finally:
+            builder.close()
+        self._body = self._environ["wsgi.input"].read()
+        self._app = app.wsgi_app
+        self.status = ""
+
+    def _start_response(self, status: str, headers: Any, exc_info: Any = None) -> None:
+        self.status = status
+
+    def make_environ(self) -> Dict[str, Any]:
+        environ = dict(self._environ)
+        environ["wsgi.input"] = io.BytesIO(self._body)
+        return environ
+
+    def __call__(self) -> None:
+        for _ in self._app(self.make_environ(), self._start_response):
+            pass
+
+
+def _package_version(name: str) -> Optional[str]:
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return None
+
+
+def metadata() -> Dict[str, Any]:
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "packages": {
+            name: _package_version(name)
+            for name in ("flask", "werkzeug", "pydantic", "pydantic-core")
+        },
+    }
+
+
+def write_results(path: str, name: str, results: List[Dict[str, Any]]) -> None:
+    with open(path, "w") as f:
+        json.dump(
+            {"benchmark": name, "metadata": metadata(), "results": results},
+            f,
+            indent=2,
+        )
+
+
+def compare_results(path: str, results: List[Dict[str, Any]]) -> None:
+    with open(path) as f:
+        baseline = {result["name"]: result for result in json.load(f)["results"]}
+    print(f"\n{'case':<48} {'baseline':>12} {'current':>12} {'ratio':>8}")
+    for result in results:
+        previous = baseline.get(result["name"])
+        if previous is None:
+            continue
+        ratio = result["median_us"] / previous["median_us"]
+        print(
+            f"{result['name']:<48} {previous['median_us']:>10.1f}us "
+            f"{result['median_us']:>10.1f}us {ratio:>7.2f}x"
+        )
+
+
+def print_result(result: Dict[str, Any]) -> None:
+    print(
+        f"{result['name']:<48} {result['median_us']:>10.1f}us median "
+        f"{result['p99_us']:>10.1f}us p99 ({result['rounds']} rounds)"
+    )
@@ -1,14 +1,29 @@
 """Flask Parameter Validator"""
 
+from ._params import type_adapter_registry as type_adapter_registry
+from .body_parsers import register_body_parser as register_body_parser
+from .concurrency import set_bulk_executor as set_bulk_executor
+from .concurrency import set_offload_executor as set_offload_executor
+from .encoders import json_response as json_response
+from .encoders import set_json_encoder as set_json_encoder
 from .exception_handlers import exception_handler as exception_handler
 from .exception_handlers import (
     internal_server_error_handler as internal_server_error_handler,
 )
+from .exception_handlers import (
+    request_entity_too_large_handler as request_entity_too_large_handler,
+)
 from .exception_handlers import (
     request_vaildation_error_handler as request_vaildation_error_handler,
 )
+from .exception_handlers import (
+    response_validation_error_handler as response_validation_error_handler,
+)
 from .exceptions import InternalServerError as InternalServerError
+from .exceptions import RequestEntityTooLarge as RequestEntityTooLarge
 from .exceptions import RequestValidationError as RequestValidationError
+from .exceptions import ResponseValidationError as ResponseValidationError
+from .multipart import UploadedFile as UploadedFile
 from .param_functions import Body as Body
 from .param_functions import Cookie as Cookie
 from .param_functions import File as File
@@ -16,6 +31,11 @@ from .param_functions import Form as Form
 from .param_functions import Header as Header
 from .param_functions import Path as Path
 from .param_functions import Query as Query
+from .partial import PartialResult as PartialResult
+from .timing import LoggingTimingSink as LoggingTimingSink
+from .timing import TimingStats as TimingStats
+from .timing import set_timing_sink as set_timing_sink
 from .validator import parameter_validator as parameter_validator
+from .validator import warmup as warmup
 
 __version__ = "0.0.1"
@@ -1,20 +1,29 @@
+import collections.abc
+import hashlib
 from typing import (
     Annotated,
     Any,
     Callable,
     Dict,
+    Hashable,
     List,
     Literal,
+    NamedTuple,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Union,
+    get_args,
+    get_origin,
 )
 
-from pydantic import TypeAdapter
+from pydantic import ConfigDict, TypeAdapter
 from pydantic.fields import FieldInfo
 from pydantic_core import ErrorDetails, PydanticUndefined, ValidationError
 
+from flask_request_data_validator.bulk import DEFAULT_BULK_MIN_BYTES
+from flask_request_data_validator.partial import PartialResult
 from flask_request_data_validator.utils import annotation_is_file_sequence
 from flask_request_data_validator.utils import (
     annotation_is_sequence as _annotation_is_sequence,
@@ -23,6 +32,74 @@ from flask_request_data_validator.utils import (
 IncEx = Union[Set[int], Set[str], Dict[int, Any], Dict[str, Any]]
 
 
+class RegistryInfo(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+
+
+class TypeAdapterRegistry:
+    def __init__(self) -> None:
+        self._adapters: Dict[Hashable, TypeAdapter[Any]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def get(
+        self, field_info: FieldInfo, config: Optional[ConfigDict] = None
+    ) -> TypeAdapter[Any]:
+        annotation = self._normalize_annotation(field_info.annotation)
+        key = self._make_key(annotation, field_info, config)
+        adapter = self._adapters.get(key) if key is not None else None
+        if adapter is not None:
+            self._hits += 1
+            return adapter
+        self._misses += 1
+        adapter = TypeAdapter(Annotated[annotation, field_info], config=config)  # type: ignore
+        if key is not None:
+            self._adapters[key] = adapter
+        return adapter
+
+    def info(self) -> RegistryInfo:
+        return RegistryInfo(self._hits, self._misses, len(self._adapters))
+
+    def clear(self) -> None:
+        self._adapters.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def _normalize_annotation(self, annotation: Any) -> Any:
+        if get_origin(annotation) is not Annotated:
+            return annotation
+        args = get_args(annotation)
+        metadata = tuple(arg for arg in args[1:] if not isinstance(arg, FieldAdapter))
+        if not metadata:
+            return args[0]
+        return Annotated[(args[0], *metadata)]  # type: ignore
+
+    def _make_key(
+        self, annotation: Any, field_info: FieldInfo, config: Optional[ConfigDict]
+    ) -> Optional[Hashable]:
+        try:
+            key = (
+                annotation,
+                tuple(self._metadata_key(item) for item in field_info.metadata),
+                field_info.discriminator,
+                tuple(sorted(config.items())) if config else None,
+            )
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _metadata_key(self, item: Any) -> Hashable:
+        if type(item).__hash__ is object.__hash__ and hasattr(item, "__dict__"):
+            return (type(item), tuple(sorted(vars(item).items())))
+        return item
+
+
+type_adapter_registry = TypeAdapterRegistry()
+
+
 class FieldAdapter:
     def __init__(
         self,
@@ -52,17 +129,17 @@ class FieldAdapter:
             max_length=max_length,
             **extra,
         )
-        self._type_adapter: TypeAdapter[Any] = self._get_type_adapter()
+        self._type_adapter: Optional[TypeAdapter[Any]] = None
 
     def _get_type_adapter(self) -> TypeAdapter[Any]:
-        return TypeAdapter(Annotated[self.field_info.annotation, self.field_info])  # type: ignore
+        return type_adapter_registry.get(self.field_info)
 
     def validate(
         self, obj: Any, loc: Tuple[str, ...]
     ) -> Tuple[Any, List[Dict[str, Any]]]:
         value, errors = None, []
         try:
-            value = self._type_adapter.validate_python(obj, from_attributes=True)
+            value = self.type_adapter.validate_python(obj, from_attributes=True)
         except ValidationError as exc:
             errors = self._regenerate_with_loc(exc.errors(), loc=loc)
         return value, errors
@@ -81,7 +158,7 @@ class FieldAdapter:
         round_trip: bool = False,
         warnings: bool = True,
     ):
-        return self._type_adapter.dump_python(
+        return self.type_adapter.dump_python(
             __instance,
             mode=mode,
             include=include,
@@ -97,6 +174,19 @@ class FieldAdapter:
     def _regenerate_with_loc(self, errors: List[ErrorDetails], loc: Tuple[str, ...]):
         return [{**error, "loc": loc + error["loc"]} for error in errors]
 
+    def list_item_annotation(self, iterable: bool = False) -> Optional[Any]:
+        annotation = self.annotation
+        if get_origin(annotation) is Annotated:
+            annotation, *metadata = get_args(annotation)
+            if any(not isinstance(item, FieldAdapter) for item in metadata):
+                return None
+        origins: Tuple[Any, ...] = (list,)
+        if iterable:
+            origins = (list, collections.abc.Iterator, collections.abc.Iterable)
+        if get_origin(annotation) not in origins or self.field_info.metadata:
+            return None
+        return get_args(annotation)[0]
+
     @property
     def default(self) -> Any:
         return self.field_info.default
@@ -108,7 +198,13 @@ class FieldAdapter:
     @field_info.setter
     def field_info(self, field_info: FieldInfo):
         self._field_info = field_info
-        self._type_adapter = self._get_type_adapter()
+        self._type_adapter = None
+
+    @property
+    def type_adapter(self) -> TypeAdapter[Any]:
+        if self._type_adapter is None:
+            self._type_adapter = self._get_type_adapter()
+        return self._type_adapter
 
     @property
     def alias(self) -> Optional[str]:
@@ -211,6 +307,11 @@ class Body(FieldAdapter):
         *,
         embed: bool = False,
         media_type: str = "application/json",
+        max_bytes: Optional[int] = None,
+        bulk_chunk_size: Optional[int] = None,
+        bulk_min_bytes: int = DEFAULT_BULK_MIN_BYTES,
+        partial: bool = False,
+        stream: Optional[Literal["ndjson", "json"]] = None,
         alias: Optional[str] = None,
         title: Optional[str] = None,
         description: Optional[str] = None,
@@ -224,6 +325,12 @@ class Body(FieldAdapter):
     ) -> None:
         self.embed = embed
         self.media_type = media_type
+        self.max_bytes = max_bytes
+        self.bulk_chunk_size = bulk_chunk_size
+        self.bulk_min_bytes = bulk_min_bytes
+        self.partial = partial
+        self.stream = stream
+        self._item_type_adapter: Optional[TypeAdapter[Any]] = None
         super().__init__(
             default=default,
             alias=alias,
@@ -242,6 +349,37 @@ class Body(FieldAdapter):
     def loc(self) -> str:
         return "body"
 
+    @property
+    def item_type_adapter(self) -> TypeAdapter[Any]:
+        if self._item_type_adapter is None:
+            self._item_type_adapter = type_adapter_registry.get(
+                FieldInfo.from_annotation(self.list_item_annotation(iterable=True))
+            )
+        return self._item_type_adapter
+
+    def validate_partial(
+        self, obj: Any, loc: Tuple[str, ...]
+    ) -> Tuple[Optional[PartialResult[Any]], List[Dict[str, Any]]]:
+        if not isinstance(obj, list):
+            value, errors = self.validate(obj, loc=loc)
+            if errors:
+                return None, errors
+            obj = value
+        items: List[Any] = []
+        indexes: List[int] = []
+        errors = []
+        item_type_adapter = self.item_type_adapter
+        for index, item in enumerate(obj):
+            try:
+                items.append(
+                    item_type_adapter.validate_python(item, from_attributes=True)
+                )
+            except ValidationError as exc:
+                errors.extend(self._regenerate_with_loc(exc.errors(), loc + (index,)))
+            else:
+                indexes.append(index)
+        return PartialResult(items, indexes, errors), []  # type: ignore[arg-type]
+
 
 class Form(Body):
     def __init__(
@@ -250,6 +388,7 @@ class Form(Body):
         *,
         embed: bool = False,
         media_type: str = "application/x-www-form-urlencoded",
+        max_bytes: Optional[int] = None,
         alias: Optional[str] = None,
         title: Optional[str] = None,
         description: Optional[str] = None,
@@ -265,6 +404,7 @@ class Form(Body):
             default,
             embed=embed,
             media_type=media_type,
+            max_bytes=max_bytes,
             alias=alias,
             title=title,
             description=description,
@@ -285,6 +425,10 @@ class File(Form):
         *,
         embed: bool = False,
         media_type: str = "multipart/form-data",
+        max_bytes: Optional[int] = None,
+        content_types: Optional[Sequence[str]] = None,
+        digests: Optional[Sequence[str]] = None,
+        sniff: bool = False,
         alias: Optional[str] = None,
         title: Optional[str] = None,
         description: Optional[str] = None,
@@ -296,10 +440,24 @@ class File(Form):
         max_length: Optional[int] = None,
         **extra: Any,
     ) -> None:
+        self.content_types = tuple(content_types) if content_types else None
+        self.digests = tuple(digests) if digests else ()
+        for name in self.digests:
+            if name == "crc32":
+                continue
+            try:
+                hasher = hashlib.new(name, usedforsecurity=False)
+            except ValueError:
+                raise ValueError(f"Unsupported digest {name!r}") from None
+            # shake_* digests need a length for hexdigest().
+            if not hasher.digest_size:
+                raise ValueError(f"Digest {name!r} has no fixed length")
+        self.sniff = sniff
         super().__init__(
             default,
             embed=embed,
             media_type=media_type,
+            max_bytes=max_bytes,
             alias=alias,
             title=title,
             description=description,
@@ -317,7 +475,9 @@ class File(Form):
         return annotation_is_file_sequence(self.field_info.annotation)
 
     def _get_type_adapter(self) -> TypeAdapter[Any]:
-        return TypeAdapter(Annotated[self.field_info.annotation, self.field_info], config={"arbitrary_types_allowed": True})  # type: ignore
+        return type_adapter_registry.get(
+            self.field_info, config={"arbitrary_types_allowed": True}
+        )
 
 
 class Depends:
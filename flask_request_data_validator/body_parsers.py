@@ -0,0 +1,74 @@
+import json
+from typing import Any, Callable, Dict, Set
+
+from flask import Request
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None  # type: ignore
+
+BodyParser = Callable[[Request, bytes], Any]
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+
+
+def parse_json(request: Request, body: bytes) -> Any:
+    return json.loads(body)
+
+
+def parse_form(request: Request, body: bytes) -> Any:
+    return dict(request.form)
+
+
+def parse_bytes(request: Request, body: bytes) -> Any:
+    return body or None
+
+
+def parse_text(request: Request, body: bytes) -> Any:
+    if not body:
+        return None
+    return body.decode(request.mimetype_params.get("charset", "utf-8"))
+
+
+def parse_msgpack(request: Request, body: bytes) -> Any:
+    return msgpack.unpackb(body)
+
+
+body_parsers: Dict[str, BodyParser] = {
+    "application/json": parse_json,
+    "application/x-www-form-urlencoded": parse_form,
+    "multipart/form-data": parse_form,
+    "application/octet-stream": parse_bytes,
+    "text/plain": parse_text,
+}
+json_compatible_media_types: Set[str] = set()
+
+
+def register_body_parser(
+    media_type: str, parser: BodyParser, *, json_compatible: bool = False
+) -> None:
+    media_type = media_type.lower()
+    body_parsers[media_type] = parser
+    if json_compatible:
+        json_compatible_media_types.add(media_type)
+    else:
+        json_compatible_media_types.discard(media_type)
+
+
+if msgpack is not None:
+    for _media_type in MSGPACK_MEDIA_TYPES:
+        register_body_parser(_media_type, parse_msgpack)
+
+
+def resolve_body_parser(media_type: str) -> BodyParser:
+    media_type = media_type.lower()
+    parser = body_parsers.get(media_type)
+    if parser is not None:
+        return parser
+    if media_type.endswith("+json"):
+        return parse_json
+    if media_type.startswith("text/"):
+        return parse_text
+    return parse_bytes
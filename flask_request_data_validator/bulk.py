@@ -0,0 +1,189 @@
+import re
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from pydantic import TypeAdapter
+from pydantic_core import ErrorDetails, ValidationError, from_json
+
+from flask_request_data_validator.utils import PYTHON_ERROR_TYPES
+
+_ESCAPE = re.compile(rb"\\.", re.DOTALL)
+_NOT_STRUCTURE = bytes(byte for byte in range(256) if byte not in b'"[]{}')
+_WHITESPACE = b" \t\n\r"
+_SAMPLE_ITEMS = 16
+
+DEFAULT_BULK_MIN_BYTES = 1024 * 1024
+
+bulk_annotations: List[Any] = []
+_worker_adapters: Dict[Any, TypeAdapter[Any]] = {}
+
+
+def _depth(data: bytes) -> int:
+    return data.count(b"[") + data.count(b"{") - data.count(b"]") - data.count(b"}")
+
+
+class _ArrayScanner:
+    # Finds the commas between the items of a JSON array without decoding them.
+    # Escapes are masked out, so quotes always open or close a string. Each span
+    # is reduced to its quotes and brackets; adjacent quotes have no bracket
+    # between them and are dropped in pairs, which leaves few enough pieces to
+    # count the brackets outside strings exactly.
+    def __init__(self, data: bytes, start: int, end: int) -> None:
+        self.data = data
+        self.end = end
+        self.counted = start
+        self.quotes = 0
+        self.depth = 0
+
+    def _count(self, stop: int) -> None:
+        structure = self.data[self.counted : stop].translate(None, _NOT_STRUCTURE)
+        pieces = structure.replace(b'""', b"").split(b'"')
+        self.depth += _depth(b"".join(pieces[self.quotes % 2 :: 2]))
+        self.quotes += structure.count(b'"')
+        self.counted = stop
+
+    def next_separator(self, pos: int) -> Optional[int]:
+        data, end = self.data, self.end
+        while True:
+            comma = data.find(b",", pos, end)
+            if comma < 0:
+                return None
+            self._count(comma)
+            if self.quotes % 2:
+                pos = data.find(b'"', comma, end) + 1
+                if not pos:
+                    return None
+                continue
+            if self.depth == 0:
+                return comma
+            if self.depth < 0:
+                return None
+            closing = [
+                index
+                for index in (data.find(b"]", comma, end), data.find(b"}", comma, end))
+                if index >= 0
+            ]
+            if not closing:
+                return None
+            pos = min(closing) + 1
+
+
+def split_json_array(data: bytes, chunk_size: int) -> Optional[List[bytes]]:
+    start = 0
+    while start < len(data) and data[start] in _WHITESPACE:
+        start += 1
+    end = len(data) - 1
+    while end > start and data[end] in _WHITESPACE:
+        end -= 1
+    if data[start : start + 1] != b"[" or end <= start or data[end] != ord("]"):
+        return None
+    masked = _ESCAPE.sub(b"__", data) if b"\\" in data else data
+    scanner = _ArrayScanner(masked, start + 1, end)
+    sample = min(chunk_size, _SAMPLE_ITEMS)
+    separators: List[int] = []
+    while len(separators) < sample:
+        pos = separators[-1] + 1 if separators else start + 1
+        separator = scanner.next_separator(pos)
+        if separator is None:
+            break
+        separators.append(separator)
+    if len(separators) < sample:
+        return [data[start : end + 1]]
+    stride = (separators[-1] - separators[0]) / max(sample - 1, 1)
+    cuts = [separators[-1]] if sample == chunk_size else []
+    remaining = chunk_size - sample or chunk_size
+    pos = separators[-1] + 1
+    while True:
+        separator = scanner.next_separator(pos + int((remaining - 1) * stride))
+        if separator is None:
+            break
+        cuts.append(separator)
+        remaining = chunk_size
+        pos = separator + 1
+    chunks: List[bytes] = []
+    for chunk_start, chunk_end in zip([start] + cuts, cuts + [end]):
+        items = data[chunk_start + 1 : chunk_end].strip(_WHITESPACE)
+        if not items and cuts:
+            return None
+        chunks.append(b"[" + items + b"]")
+    return chunks
+
+
+def _worker_adapter(annotation: Any) -> TypeAdapter[Any]:
+    adapter = _worker_adapters.get(annotation)
+    if adapter is None:
+        adapter = _worker_adapters[annotation] = TypeAdapter(annotation)
+    return adapter
+
+
+def init_worker(annotations: Tuple[Any, ...]) -> None:
+    for annotation in annotations:
+        _worker_adapter(annotation)
+
+
+def validate_chunk(
+    annotation: Any, chunk: bytes
+) -> Tuple[List[Any], List[ErrorDetails], int]:
+    try:
+        values = _worker_adapter(annotation).validate_json(chunk)
+    except ValidationError as exc:
+        errors = exc.errors()
+        if any(error["type"] == "json_invalid" for error in errors):
+            return [], errors, 0
+        return [], errors, len(from_json(chunk))
+    return values, [], len(values)
+
+
+class BulkValidator:
+    def __init__(
+        self,
+        annotation: Any,
+        chunk_size: int,
+        loc: Tuple[Union[str, int], ...],
+        min_bytes: int = DEFAULT_BULK_MIN_BYTES,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("bulk_chunk_size must be at least 1")
+        self.annotation = annotation
+        self.chunk_size = chunk_size
+        self.loc = loc
+        self.min_bytes = min_bytes
+        if annotation not in bulk_annotations:
+            bulk_annotations.append(annotation)
+
+    def validate(
+        self, body: bytes, get_executor: Callable[[], Executor]
+    ) -> Optional[Tuple[List[Any], List[ErrorDetails]]]:
+        if len(body) < self.min_bytes:
+            return None
+        chunks = split_json_array(body, self.chunk_size)
+        if chunks is None or len(chunks) < 2:
+            return None
+        executor = get_executor()
+        futures = [
+            executor.submit(validate_chunk, self.annotation, chunk) for chunk in chunks
+        ]
+        items: List[Any] = []
+        errors: List[ErrorDetails] = []
+        offset = 0
+        for future in futures:
+            values, _errors, count = future.result()
+            for error in _errors:
+                if error["type"] in PYTHON_ERROR_TYPES:
+                    return None
+                loc = error["loc"]
+                if loc and isinstance(loc[0], int):
+                    loc = (loc[0] + offset, *loc[1:])
+                errors.append({**error, "loc": self.loc + loc})  # type: ignore
+            offset += count
+            if errors:
+                items.clear()
+            else:
+                items.extend(values)
+        return items, errors
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({self.annotation!r}, "
+            f"chunk_size={self.chunk_size}, min_bytes={self.min_bytes})"
+        )
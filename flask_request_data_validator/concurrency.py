@@ -0,0 +1,50 @@
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+from flask_request_data_validator.bulk import bulk_annotations, init_worker
+
+DEFAULT_OFFLOAD_THRESHOLD = 1024 * 1024
+DEFAULT_BULK_WORKERS = 2
+
+_offload_executor: Optional[Executor] = None
+_bulk_executor: Optional[Executor] = None
+_lock = threading.Lock()
+
+
+def get_offload_executor() -> Executor:
+    global _offload_executor
+    if _offload_executor is None:
+        with _lock:
+            if _offload_executor is None:
+                _offload_executor = ThreadPoolExecutor(
+                    max_workers=min(4, os.cpu_count() or 1),
+                    thread_name_prefix="request-validation",
+                )
+    return _offload_executor
+
+
+def set_offload_executor(executor: Optional[Executor]) -> None:
+    global _offload_executor
+    with _lock:
+        _offload_executor = executor
+
+
+def get_bulk_executor() -> Executor:
+    global _bulk_executor
+    if _bulk_executor is None:
+        with _lock:
+            if _bulk_executor is None:
+                _bulk_executor = ProcessPoolExecutor(
+                    max_workers=min(DEFAULT_BULK_WORKERS, os.cpu_count() or 1),
+                    initializer=init_worker,
+                    initargs=(tuple(bulk_annotations),),
+                )
+    return _bulk_executor
+
+
+def set_bulk_executor(executor: Optional[Executor]) -> None:
+    global _bulk_executor
+    with _lock:
+        _bulk_executor = executor
@@ -1,8 +1,14 @@
 import inspect
-from typing import Any, Dict, List, Optional, Tuple, TypeVar, Union
+from typing import Any, Dict, List, Optional, Tuple, TypeVar, Union, cast
 
 from pydantic import BaseModel, ValidationError
-from pydantic_core import ErrorDetails, PydanticUndefined
+from pydantic_core import (
+    CoreSchema,
+    ErrorDetails,
+    PydanticUndefined,
+    SchemaValidator,
+    core_schema,
+)
 from werkzeug.datastructures import FileStorage, Headers, MultiDict
 
 from flask_request_data_validator._params import (
@@ -15,10 +21,128 @@ from flask_request_data_validator._params import (
     Path,
     Query,
 )
+from flask_request_data_validator.body_parsers import (
+    MSGPACK_MEDIA_TYPES,
+    BodyParser,
+    json_compatible_media_types,
+    parse_bytes,
+    parse_form,
+    parse_json,
+    resolve_body_parser,
+)
+from flask_request_data_validator.bulk import BulkValidator
+from flask_request_data_validator.multipart import FileLimit
+from flask_request_data_validator.utils import PYTHON_ERROR_TYPES
 
 ParamType = TypeVar("ParamType", bound=FieldAdapter)
 
 
+class FieldPlan:
+    __slots__ = (
+        "name",
+        "field",
+        "key",
+        "loc",
+        "getlist",
+        "required",
+        "index",
+        "_missing_error",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        field: FieldAdapter,
+        *,
+        key: str,
+        loc: Tuple[str, ...],
+        getlist: bool,
+        index: int = 0,
+    ) -> None:
+        self.name = name
+        self.field = field
+        self.key = key
+        self.loc = loc
+        self.getlist = getlist
+        self.required = field.default in (inspect.Signature.empty, PydanticUndefined)
+        self.index = index
+        self._missing_error: ErrorDetails = ValidationError.from_exception_data(
+            "Field required",
+            [
+                {
+                    "type": "missing",
+                    "loc": self.loc,
+                    "input": None,
+                }
+            ],
+        ).errors()[0]
+
+    def missing_error(self) -> ErrorDetails:
+        return self._missing_error.copy()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r}, loc={self.loc!r})"
+
+
+class CombinedValidator:
+    def __init__(self, plans: Dict[str, FieldPlan], required: bool = False) -> None:
+        self._plans = plans
+        self._required = required
+        self._validator: Optional[SchemaValidator] = None
+
+    @property
+    def validator(self) -> SchemaValidator:
+        if self._validator is None:
+            self._validator = self._get_validator()
+        return self._validator
+
+    def _get_validator(self) -> SchemaValidator:
+        definitions: Dict[str, CoreSchema] = {}
+        fields: Dict[str, core_schema.TypedDictField] = {}
+        for key, plan in self._plans.items():
+            schema = plan.field.type_adapter.core_schema
+            if schema["type"] == "definitions":
+                for definition in schema["definitions"]:
+                    definitions[definition["ref"]] = definition  # type: ignore
+                schema = schema["schema"]
+            if schema["type"] == "default":
+                schema = schema["schema"]
+            fields[key] = core_schema.typed_dict_field(
+                schema, required=self._required and plan.required
+            )
+        schema = core_schema.typed_dict_schema(fields)
+        if definitions:
+            schema = core_schema.definitions_schema(schema, list(definitions.values()))
+        return SchemaValidator(schema)
+
+    def validate(
+        self, inputs: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], List[Tuple[int, ErrorDetails]]]:
+        try:
+            validated = self.validator.validate_python(inputs, from_attributes=True)
+        except ValidationError as exc:
+            errors: List[Tuple[int, ErrorDetails]] = []
+            for error in exc.errors():
+                plan = self._plans[error["loc"][0]]  # type: ignore
+                errors.append(
+                    (plan.index, {**error, "loc": plan.loc + error["loc"][1:]})  # type: ignore
+                )
+            return {}, errors
+        return {
+            self._plans[key].name: value
+            for key, value in validated.items()
+            if value is not None
+        }, []
+
+    def validate_json(
+        self, data: bytes
+    ) -> Tuple[Optional[Dict[str, Any]], List[ErrorDetails]]:
+        try:
+            return self.validator.validate_json(data), []
+        except ValidationError as exc:
+            return None, exc.errors()
+
+
 class Dependant:
     def __init__(
         self,
@@ -36,6 +160,22 @@ class Dependant:
         self.body_params = body_params or {}
         self.file_params = file_params or {}
         self.cookie_params = cookie_params or {}
+        self.path_plans: List[FieldPlan] = []
+        self.query_plans: List[FieldPlan] = []
+        self.header_plans: List[FieldPlan] = []
+        self.body_plans: List[FieldPlan] = []
+        self.file_plans: List[FieldPlan] = []
+        self.cookie_plans: List[FieldPlan] = []
+        self.body_alias_omitted = False
+        self.form_body = False
+        self.combined_validator: Optional[CombinedValidator] = None
+        self.body_validator: Optional[CombinedValidator] = None
+        self.bulk_validator: Optional[BulkValidator] = None
+        self.partial_body = False
+        self.stream_plan: Optional[FieldPlan] = None
+        self.file_limits: Dict[str, FileLimit] = {}
+        self.body_parsers: Dict[str, BodyParser] = {}
+        self.fallback_body_parser: BodyParser = parse_bytes
 
     @property
     def is_form_type(self) -> bool:
@@ -43,140 +183,416 @@ class Dependant:
             param for param in self.body_params.values() if isinstance(param, Form)
         )
 
+    @property
+    def plans(self) -> List[FieldPlan]:
+        return [
+            *self.header_plans,
+            *self.path_plans,
+            *self.query_plans,
+            *self.file_plans,
+            *self.cookie_plans,
+            *self.body_plans,
+        ]
+
+    def compile(self, combined: bool = False, msgpack: bool = False) -> None:
+        self.header_plans = self._compile_params(self.header_params)
+        self.path_plans = self._compile_params(self.path_params, getlist=False)
+        self.query_plans = self._compile_params(self.query_params)
+        self.file_plans = self._compile_params(self.file_params)
+        self.cookie_plans = self._compile_params(self.cookie_params)
+        self.file_limits = {}
+        for plan in self.file_plans:
+            field = cast(File, plan.field)
+            if (
+                field.max_bytes is not None
+                or field.content_types is not None
+                or field.digests
+                or field.sniff
+            ):
+                self.file_limits[plan.key] = FileLimit(
+                    plan.loc,
+                    field.max_bytes,
+                    field.content_types,
+                    field.digests,
+                    field.sniff,
+                )
+
+        self.body_alias_omitted = False
+        if self.body_params:
+            first = next(iter(self.body_params.values()))
+            embed = getattr(first, "embed", False)
+            self.body_alias_omitted = len(self.body_params) == 1 and not embed
+        self.body_plans = [
+            FieldPlan(
+                param_name,
+                param,
+                key=param_name,
+                loc=("body",) if self.body_alias_omitted else ("body", param_name),
+                getlist=False,
+            )
+            for param_name, param in self.body_params.items()
+        ]
+        self.form_body = self.is_form_type
+        self.body_parsers = self._compile_body_parsers(msgpack)
+        self.fallback_body_parser = parse_form if self.form_body else parse_bytes
+        self.body_validator = None
+        if self.body_plans and not self.body_alias_omitted and not self.form_body:
+            self.body_validator = CombinedValidator(
+                {plan.key: plan for plan in self.body_plans}, required=True
+            )
+        self.bulk_validator = self._compile_bulk()
+        self.partial_body = self._compile_partial(combined)
+        self.stream_plan = self._compile_stream(combined)
+
+        plans = self.plans
+        for index, plan in enumerate(plans):
+            plan.index = index
+        self.combined_validator = None
+        if combined and plans:
+            self.combined_validator = CombinedValidator(
+                {str(plan.index): plan for plan in plans}
+            )
+
+    def _compile_body_parsers(self, msgpack: bool = False) -> Dict[str, BodyParser]:
+        body_parsers: Dict[str, BodyParser] = {}
+        for plan in self.body_plans:
+            media_type = plan.field.media_type.lower()  # type: ignore[attr-defined]
+            parser = resolve_body_parser(media_type)
+            if parser is parse_form:
+                body_parsers.setdefault("application/x-www-form-urlencoded", parser)
+                body_parsers.setdefault("multipart/form-data", parser)
+            body_parsers.setdefault(media_type, parser)
+        if body_parsers:
+            body_parsers[""] = next(iter(body_parsers.values()))
+        if parse_json in body_parsers.values():
+            media_types = set(json_compatible_media_types)
+            if msgpack:
+                media_types.update(MSGPACK_MEDIA_TYPES)
+            for media_type in media_types:
+                body_parsers.setdefault(media_type, resolve_body_parser(media_type))
+        return body_parsers
+
+    def get_body_parser(self, mimetype: str) -> BodyParser:
+        parser = self.body_parsers.get(mimetype)
+        if parser is not None:
+            return parser
+        if mimetype.endswith("+json") and parse_json in self.body_parsers.values():
+            return parse_json
+        return self.fallback_body_parser
+
+    def _compile_bulk(self) -> Optional[BulkValidator]:
+        bulk_plans = [
+            plan
+            for plan in self.body_plans
+            if getattr(plan.field, "bulk_chunk_size", None) is not None
+        ]
+        if not bulk_plans:
+            return None
+        plan = bulk_plans[0]
+        if not self.body_alias_omitted or self.form_body:
+            raise ValueError(
+                f"Bulk body {plan.name!r} must be the only, non-embedded JSON body"
+            )
+        item_annotation = plan.field.list_item_annotation()
+        if item_annotation is None:
+            raise ValueError(
+                f"Bulk body {plan.name!r} must be an unconstrained list annotation"
+            )
+        if plan.field.partial:  # type: ignore[attr-defined]
+            raise ValueError(f"Bulk body {plan.name!r} cannot be partial")
+        return BulkValidator(
+            List[item_annotation],  # type: ignore[valid-type]
+            plan.field.bulk_chunk_size,  # type: ignore[attr-defined]
+            plan.loc,
+            plan.field.bulk_min_bytes,  # type: ignore[attr-defined]
+        )
+
+    def _compile_partial(self, combined: bool) -> bool:
+        partial = False
+        for plan in self.body_plans:
+            if not getattr(plan.field, "partial", False):
+                continue
+            if combined:
+                raise ValueError(
+                    f"Partial body {plan.name!r} cannot use combined validation"
+                )
+            if plan.field.list_item_annotation() is None:
+                raise ValueError(
+                    f"Partial body {plan.name!r} must be an unconstrained list annotation"
+                )
+            partial = True
+        return partial
+
+    def _compile_stream(self, combined: bool) -> Optional[FieldPlan]:
+        stream_plans = [
+            plan
+            for plan in self.body_plans
+            if getattr(plan.field, "stream", None) is not None
+        ]
+        if not stream_plans:
+            return None
+        plan = stream_plans[0]
+        if not self.body_alias_omitted or self.form_body or self.file_plans:
+            raise ValueError(
+                f"Streamed body {plan.name!r} must be the only body param "
+                "and cannot be combined with files"
+            )
+        if combined:
+            raise ValueError(
+                f"Streamed body {plan.name!r} cannot use combined validation"
+            )
+        field = plan.field
+        if field.bulk_chunk_size is not None or field.partial:  # type: ignore[attr-defined]
+            raise ValueError(f"Streamed body {plan.name!r} cannot be bulk or partial")
+        if field.list_item_annotation(iterable=True) is None:
+            raise ValueError(
+                f"Streamed body {plan.name!r} must be an unconstrained "
+                "list or iterator annotation"
+            )
+        return plan
+
+    def warmup(self) -> None:
+        for plan in self.plans:
+            plan.field.type_adapter
+            if plan is self.stream_plan or getattr(plan.field, "partial", False):
+                plan.field.item_type_adapter  # type: ignore[attr-defined]
+        if self.body_validator is not None:
+            self.body_validator.validator
+        if self.combined_validator is not None:
+            self.combined_validator.validator
+
+    def _compile_params(
+        self, params: Dict[str, ParamType], getlist: bool = True
+    ) -> List[FieldPlan]:
+        plans: List[FieldPlan] = []
+        for param_name, param in params.items():
+            key = param_name
+            if isinstance(param, Header):
+                key = param_name.replace("_", "-")
+            plans.append(
+                FieldPlan(
+                    param_name,
+                    param,
+                    key=key,
+                    loc=(param.loc, key),
+                    getlist=getlist and param.annotation_is_sequence,
+                )
+            )
+        return plans
+
     def solve_body(
-        self, received_body: Optional[Union[Dict[str, Any], bytes]]
+        self,
+        received_body: Optional[Union[Dict[str, Any], bytes]],
+        fail_fast: bool = False,
     ) -> Tuple[Dict[str, BaseModel], List[Union[Dict[str, Any], ErrorDetails]]]:
         solved: Dict[str, BaseModel] = {}
         errors: List[Union[Dict[str, Any], ErrorDetails]] = []
-        if not self.body_params:
+        if not self.body_plans:
             return solved, errors
-        key = next(iter(self.body_params.keys()))
-        embed = getattr(self.body_params[key], "embed", False)
-        param_alias_omitted = len(self.body_params) == 1 and not embed
-        if param_alias_omitted:
-            received_body = {key: received_body}
-
-        for param_name, param in self.body_params.items():
-            loc: Tuple[str, ...]
-            if param_alias_omitted:
-                loc = ("body",)
-            else:
-                loc = (
-                    "body",
-                    param_name,
-                )
+        if self.body_alias_omitted:
+            received_body = {self.body_plans[0].key: received_body}
+
+        for plan in self.body_plans:
             value: Optional[Any] = None
             if received_body is not None:
-                try:
-                    if isinstance(received_body, dict):
-                        value = received_body.get(param_name)
-                    else:
-                        raise AttributeError
-                except AttributeError:
-                    error = ValidationError.from_exception_data(
-                        "Field required",
-                        [
-                            {
-                                "type": "missing",
-                                "loc": loc,
-                                "input": {},
-                            }
-                        ],
-                    ).errors()[0]
-                    error["input"] = None
-                    errors.append(error)
+                if isinstance(received_body, dict):
+                    value = received_body.get(plan.key)
+                else:
+                    errors.append(plan.missing_error())
+                    if fail_fast:
+                        break
                     continue
             if value is None:
-                if param.default in (inspect.Signature.empty, PydanticUndefined):
-                    error = ValidationError.from_exception_data(
-                        "Field required",
-                        [
-                            {
-                                "type": "missing",
-                                "loc": loc,
-                                "input": {},
-                            }
-                        ],
-                    ).errors()[0]
-                    error["input"] = None
-                    errors.append(error)
+                if plan.required:
+                    errors.append(plan.missing_error())
                 else:
-                    solved[param_name] = param.default
+                    solved[plan.name] = plan.field.default
                     continue
             else:
-                validated_param, _errors = param.validate(value, loc=loc)
+                if self.partial_body and getattr(plan.field, "partial", False):
+                    validated_param, _errors = plan.field.validate_partial(  # type: ignore[attr-defined]
+                        value, loc=plan.loc
+                    )
+                else:
+                    validated_param, _errors = plan.field.validate(value, loc=plan.loc)
                 if _errors:
                     errors.extend(_errors)
                 if validated_param is not None:
-                    solved[param_name] = validated_param
+                    solved[plan.name] = validated_param
+            if fail_fast and errors:
+                break
         return solved, errors
 
-    def _solve_params(
+    def solve_json_body(
+        self, body: bytes, fail_fast: bool = False
+    ) -> Optional[Tuple[Dict[str, Any], List[Union[Dict[str, Any], ErrorDetails]]]]:
+        if self.partial_body:
+            return None
+        solved: Dict[str, Any] = {}
+        if self.body_alias_omitted:
+            plan = self.body_plans[0]
+            try:
+                value = plan.field.type_adapter.validate_json(body)
+            except ValidationError as exc:
+                errors = exc.errors()
+                if any(
+                    not error["loc"] or error["type"] in PYTHON_ERROR_TYPES
+                    for error in errors
+                ):
+                    return None
+                return solved, [
+                    {**error, "loc": plan.loc + error["loc"]} for error in errors  # type: ignore
+                ]
+            if value is None:
+                return None
+            solved[plan.name] = value
+            return solved, []
+
+        if self.body_validator is None:
+            return None
+        validated, errors = self.body_validator.validate_json(body)
+        if validated is None:
+            return self._json_body_errors(errors, fail_fast)
+        for plan in self.body_plans:
+            value = validated.get(plan.key)
+            if value is None:
+                if plan.required:
+                    return None
+                solved[plan.name] = plan.field.default
+            else:
+                solved[plan.name] = value
+        return solved, []
+
+    def _json_body_errors(
+        self, errors: List[ErrorDetails], fail_fast: bool
+    ) -> Optional[Tuple[Dict[str, Any], List[Union[Dict[str, Any], ErrorDetails]]]]:
+        plans = {plan.key: plan for plan in self.body_plans}
+        solved_errors: List[Union[Dict[str, Any], ErrorDetails]] = []
+        first_key = None
+        for error in errors:
+            loc = error["loc"]
+            if not loc or error["type"] in PYTHON_ERROR_TYPES:
+                return None
+            if fail_fast:
+                if first_key is None:
+                    first_key = loc[0]
+                elif loc[0] != first_key:
+                    break
+            plan = plans[loc[0]]  # type: ignore[index]
+            if len(loc) > 1:
+                solved_errors.append({**error, "loc": plan.loc + loc[1:]})
+            elif error["type"] == "missing":
+                solved_errors.append(plan.missing_error())
+            elif error["input"] is None:
+                return None
+            else:
+                solved_errors.append({**error, "loc": plan.loc})
+        return {}, solved_errors
+
+    def solve_params(
         self,
         received_params: Union[Dict[str, Any], Headers, MultiDict[str, Any]],
-        params: Dict[str, ParamType],
+        plans: List[FieldPlan],
+        fail_fast: bool = False,
     ) -> Tuple[Dict[str, BaseModel], List[Union[Dict[str, Any], ErrorDetails]]]:
         solved: Dict[str, BaseModel] = {}
         errors: List[Union[Dict[str, Any], ErrorDetails]] = []
-        for param_name, param in params.items():
-            _param_name = param_name
-            if isinstance(param, Header):
-                _param_name = param_name.replace("_", "-")
-            loc: Tuple[str, ...] = (param.loc, _param_name)
+        for plan in plans:
             _received_param: Any
-            if (
-                isinstance(received_params, (Headers, MultiDict))
-                and param.annotation_is_sequence
-            ):
-                _received_param = received_params.getlist(_param_name)
+            if plan.getlist:
+                _received_param = received_params.getlist(plan.key)  # type: ignore
             else:
-                _received_param = received_params.get(_param_name)
+                _received_param = received_params.get(plan.key)
             if not _received_param:
-                if param.default in (inspect.Signature.empty, PydanticUndefined):
-                    error = ValidationError.from_exception_data(
-                        "Field required",
-                        [
-                            {
-                                "type": "missing",
-                                "loc": loc,
-                                "input": None,
-                            }
-                        ],
-                    ).errors()[0]
-                    errors.append(error)
+                if plan.required:
+                    errors.append(plan.missing_error())
+                    if fail_fast:
+                        break
                     continue
                 else:
-                    solved[param_name] = param.default
+                    solved[plan.name] = plan.field.default
                     continue
 
-            validated_param, _errors = param.validate(_received_param, loc=loc)
+            validated_param, _errors = plan.field.validate(
+                _received_param, loc=plan.loc
+            )
             if _errors:
                 errors.extend(_errors)
+                if fail_fast:
+                    break
             if validated_param is not None:
-                solved[param_name] = validated_param
+                solved[plan.name] = validated_param
         return solved, errors
 
+    def gather_body(
+        self,
+        received_body: Optional[Union[Dict[str, Any], bytes]],
+        inputs: Dict[str, Any],
+        solved: Dict[str, Any],
+        errors: List[Tuple[int, Union[Dict[str, Any], ErrorDetails]]],
+    ) -> None:
+        if self.body_alias_omitted:
+            received_body = {self.body_plans[0].key: received_body}
+
+        for plan in self.body_plans:
+            value: Optional[Any] = None
+            if received_body is not None:
+                if isinstance(received_body, dict):
+                    value = received_body.get(plan.key)
+                else:
+                    errors.append((plan.index, plan.missing_error()))
+                    continue
+            if value is None:
+                if plan.required:
+                    errors.append((plan.index, plan.missing_error()))
+                else:
+                    solved[plan.name] = plan.field.default
+            else:
+                inputs[str(plan.index)] = value
+
+    def gather_params(
+        self,
+        received_params: Union[Dict[str, Any], Headers, MultiDict[str, Any]],
+        plans: List[FieldPlan],
+        inputs: Dict[str, Any],
+        solved: Dict[str, Any],
+        errors: List[Tuple[int, Union[Dict[str, Any], ErrorDetails]]],
+    ) -> None:
+        for plan in plans:
+            _received_param: Any
+            if plan.getlist:
+                _received_param = received_params.getlist(plan.key)  # type: ignore
+            else:
+                _received_param = received_params.get(plan.key)
+            if not _received_param:
+                if plan.required:
+                    errors.append((plan.index, plan.missing_error()))
+                else:
+                    solved[plan.name] = plan.field.default
+            else:
+                inputs[str(plan.index)] = _received_param
+
     def solve_header_params(
         self, headers: Headers
     ) -> Tuple[Dict[str, BaseModel], List[Union[Dict[str, Any], ErrorDetails]]]:
-        return self._solve_params(headers, self.header_params)
+        return self.solve_params(headers, self.header_plans)
 
     def solve_path_params(
         self, path: Dict[str, Any]
     ) -> Tuple[Dict[str, BaseModel], List[Union[Dict[str, Any], ErrorDetails]]]:
-        return self._solve_params(path, self.path_params)
+        return self.solve_params(path, self.path_plans)
 
     def solve_query_params(
         self, query: MultiDict[str, Any]
     ) -> Tuple[Dict[str, BaseModel], List[Union[Dict[str, Any], ErrorDetails]]]:
-        return self._solve_params(query, self.query_params)
+        return self.solve_params(query, self.query_plans)
 
     def solve_file_params(
         self, files: MultiDict[str, FileStorage]
     ) -> Tuple[Dict[str, BaseModel], List[Union[Dict[str, Any], ErrorDetails]]]:
-        return self._solve_params(files, self.file_params)
+        return self.solve_params(files, self.file_plans)
 
     def solve_cookie_params(
         self, cookies: MultiDict[str, str]
     ) -> Tuple[Dict[str, BaseModel], List[Union[Dict[str, Any], ErrorDetails]]]:
-        return self._solve_params(cookies, self.cookie_params)
+        return self.solve_params(cookies, self.cookie_plans)
@@ -0,0 +1,74 @@
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+from flask import Response
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from flask_request_data_validator.utils import ResponseEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+JSONEncoder = Callable[[Any], bytes]
+
+
+def stdlib_encoder(obj: Any) -> bytes:
+    return json.dumps(obj, cls=ResponseEncoder).encode()
+
+
+def pydantic_encoder(obj: Any) -> bytes:
+    return to_json(obj)
+
+
+def _orjson_default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, bytes):
+        return obj.decode()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError
+
+
+def orjson_encoder(obj: Any) -> bytes:
+    return orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+json_encoders: Dict[str, JSONEncoder] = {
+    "json": stdlib_encoder,
+    "pydantic": pydantic_encoder,
+}
+if orjson is not None:
+    json_encoders["orjson"] = orjson_encoder
+
+_json_encoder: JSONEncoder = stdlib_encoder
+
+
+def set_json_encoder(encoder: Union[str, JSONEncoder]) -> None:
+    global _json_encoder
+    if isinstance(encoder, str):
+        if encoder not in json_encoders:
+            raise ValueError(
+                f"Unknown JSON encoder {encoder!r}, "
+                f"available: {', '.join(sorted(json_encoders))}"
+            )
+        encoder = json_encoders[encoder]
+    _json_encoder = encoder
+
+
+def get_json_encoder() -> JSONEncoder:
+    return _json_encoder
+
+
+def json_response(
+    obj: Any, status: int = 200, headers: Optional[Dict[str, str]] = None
+) -> Response:
+    return Response(
+        _json_encoder(obj),
+        status=status,
+        headers=headers,
+        mimetype="application/json",
+    )
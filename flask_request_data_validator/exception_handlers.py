@@ -1,32 +1,122 @@
-import json
-from typing import Any, Callable, Dict
+import logging
+from typing import Any, Callable, Dict, List, Optional
 
-from flask import Response
+from flask import Response, current_app, has_app_context
 
+from flask_request_data_validator.encoders import json_response
 from flask_request_data_validator.exceptions import (
     InternalServerError,
+    RequestEntityTooLarge,
     RequestValidationError,
+    ResponseValidationError,
 )
-from flask_request_data_validator.utils import ResponseEncoder
+
+logger = logging.getLogger("flask_request_data_validator")
+
+TRUNCATED = "..."
+
+
+def _truncate_input(value: Any, budget: List[float], depth: Optional[int]) -> Any:
+    if budget[0] <= 0:
+        return TRUNCATED
+    if isinstance(value, (str, bytes)):
+        size = int(min(budget[0], len(value)))
+        if isinstance(value, bytes):
+            head = value[:size].decode(errors="ignore")
+        else:
+            head = value[:size].encode()[:size].decode(errors="ignore")
+        budget[0] -= len(head.encode())
+        if len(head) < len(value):
+            return head + TRUNCATED
+        return head
+    if isinstance(value, dict):
+        if depth == 0:
+            return TRUNCATED
+        result: Dict[Any, Any] = {}
+        for key, item in value.items():
+            if budget[0] <= 0:
+                result[TRUNCATED] = TRUNCATED
+                break
+            budget[0] -= len(str(key))
+            result[key] = _truncate_input(
+                item, budget, None if depth is None else depth - 1
+            )
+        return result
+    if isinstance(value, (list, tuple)):
+        if depth == 0:
+            return TRUNCATED
+        items: List[Any] = []
+        for item in value:
+            if budget[0] <= 0:
+                items.append(TRUNCATED)
+                break
+            items.append(
+                _truncate_input(item, budget, None if depth is None else depth - 1)
+            )
+        return items
+    budget[0] -= len(str(value))
+    return value
+
+
+def limit_errors(
+    errors: List[Any],
+    *,
+    max_errors: Optional[int] = None,
+    max_input_bytes: Optional[int] = None,
+    max_input_depth: Optional[int] = None,
+    omit_input: bool = False,
+) -> List[Any]:
+    if max_errors is not None:
+        errors = errors[:max_errors]
+    if omit_input:
+        return [
+            {key: value for key, value in error.items() if key != "input"}
+            for error in errors
+        ]
+    if max_input_bytes is None and max_input_depth is None:
+        return errors
+    limited = []
+    for error in errors:
+        if "input" in error:
+            budget = [float("inf") if max_input_bytes is None else max_input_bytes]
+            error = {
+                **error,
+                "input": _truncate_input(error["input"], budget, max_input_depth),
+            }
+        limited.append(error)
+    return limited
 
 
 def request_vaildation_error_handler(exc: RequestValidationError):
-    return Response(
-        json.dumps({"detail": exc.errors}, cls=ResponseEncoder),
-        status=422,
-        mimetype="application/json",
-    )
+    errors = exc.errors
+    if has_app_context():
+        config = current_app.config
+        errors = limit_errors(
+            errors,
+            max_errors=config.get("VALIDATION_ERROR_MAX_ERRORS"),
+            max_input_bytes=config.get("VALIDATION_ERROR_MAX_INPUT_BYTES"),
+            max_input_depth=config.get("VALIDATION_ERROR_MAX_INPUT_DEPTH"),
+            omit_input=config.get("VALIDATION_ERROR_OMIT_INPUT", False),
+        )
+    return json_response({"detail": errors}, status=422)
 
 
 def internal_server_error_handler(exc: Exception):
-    return Response(
-        json.dumps({"detail": "Internal Server Error"}),
-        status=500,
-        mimetype="application/json",
-    )
+    return json_response({"detail": "Internal Server Error"}, status=500)
+
+
+def request_entity_too_large_handler(exc: RequestEntityTooLarge):
+    return json_response({"detail": "Request Entity Too Large"}, status=413)
+
+
+def response_validation_error_handler(exc: ResponseValidationError):
+    logger.error("Response validation failed: %s", exc.errors)
+    return json_response({"detail": "Internal Server Error"}, status=500)
 
 
 exception_handler: Dict[Any, Callable[[Any], Response]] = {
     RequestValidationError: request_vaildation_error_handler,
     InternalServerError: internal_server_error_handler,
+    RequestEntityTooLarge: request_entity_too_large_handler,
+    ResponseValidationError: response_validation_error_handler,
 }
@@ -11,3 +11,15 @@ class RequestValidationError(Exception):
 
 class InternalServerError(Exception):
     pass
+
+
+class RequestEntityTooLarge(Exception):
+    def __init__(self, max_bytes: int) -> None:
+        super().__init__()
+        self.max_bytes = max_bytes
+
+
+class ResponseValidationError(Exception):
+    def __init__(self, errors: List[Union[Dict[str, Any], ErrorDetails]]) -> None:
+        super().__init__()
+        self.errors = errors
@@ -0,0 +1,236 @@
+import hashlib
+import mmap
+import tempfile
+import zlib
+from contextlib import contextmanager
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from werkzeug.datastructures import FileStorage
+from werkzeug.formparser import FormDataParser, MultiPartParser
+from werkzeug.sansio.multipart import File
+
+from flask_request_data_validator.exceptions import (
+    RequestEntityTooLarge,
+    RequestValidationError,
+)
+
+DEFAULT_SPOOL_THRESHOLD = 500 * 1024
+SNIFF_BYTES = 16
+
+MAGIC_SIGNATURES: List[Tuple[int, bytes, str]] = [
+    (0, b"\x89PNG\r\n\x1a\n", "image/png"),
+    (0, b"\xff\xd8\xff", "image/jpeg"),
+    (0, b"GIF87a", "image/gif"),
+    (0, b"GIF89a", "image/gif"),
+    (8, b"WEBP", "image/webp"),
+    (0, b"II*\x00", "image/tiff"),
+    (0, b"MM\x00*", "image/tiff"),
+    (0, b"%PDF-", "application/pdf"),
+    (0, b"PK\x03\x04", "application/zip"),
+    (0, b"\x1f\x8b", "application/gzip"),
+    (4, b"ftyp", "video/mp4"),
+]
+
+
+class FileLimit(NamedTuple):
+    loc: Tuple[str, ...]
+    max_bytes: Optional[int]
+    content_types: Optional[Tuple[str, ...]]
+    digests: Tuple[str, ...] = ()
+    sniff: bool = False
+
+
+class CRC32:
+    name = "crc32"
+
+    def __init__(self) -> None:
+        self.value = 0
+
+    def update(self, data: bytes) -> None:
+        self.value = zlib.crc32(data, self.value)
+
+    def hexdigest(self) -> str:
+        return f"{self.value:08x}"
+
+
+def new_digest(name: str) -> Any:
+    if name == "crc32":
+        return CRC32()
+    return hashlib.new(name, usedforsecurity=False)
+
+
+def sniff_content_type(head: bytes) -> Optional[str]:
+    for offset, signature, content_type in MAGIC_SIGNATURES:
+        if head[offset : offset + len(signature)] == signature:
+            return content_type
+    return None
+
+
+def content_type_allowed(content_type: Optional[str], allowed: Sequence[str]) -> bool:
+    mimetype = (content_type or "").split(";", 1)[0].strip().lower()
+    for pattern in allowed:
+        if pattern.endswith("/*"):
+            if mimetype.startswith(pattern[:-1]):
+                return True
+        elif mimetype == pattern:
+            return True
+    return False
+
+
+class UploadSpool(tempfile.SpooledTemporaryFile):  # type: ignore[type-arg]
+    def __init__(
+        self,
+        max_size: int,
+        max_bytes: Optional[int] = None,
+        digests: Sequence[str] = (),
+        sniff: bool = False,
+    ) -> None:
+        super().__init__(max_size=max_size, mode="rb+")
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hashers = {name: new_digest(name) for name in digests}
+        self.head = bytearray() if sniff else None
+
+    def write(self, data: Any) -> int:
+        self.size += len(data)
+        if self.max_bytes is not None and self.size > self.max_bytes:
+            raise RequestEntityTooLarge(self.max_bytes)
+        for hasher in self.hashers.values():
+            hasher.update(data)
+        if self.head is not None and len(self.head) < SNIFF_BYTES:
+            self.head += data[: SNIFF_BYTES - len(self.head)]
+        return super().write(data)
+
+
+class UploadedFile(FileStorage):
+    stream: UploadSpool
+
+    @property
+    def size(self) -> int:
+        return self.stream.size
+
+    @property
+    def digests(self) -> Dict[str, str]:
+        hashers = self.stream.hashers
+        return {name: hasher.hexdigest() for name, hasher in hashers.items()}
+
+    @property
+    def sniffed_type(self) -> Optional[str]:
+        if self.stream.head is None:
+            return None
+        return sniff_content_type(bytes(self.stream.head))
+
+    # SpooledTemporaryFile has no public way to tell whether it rolled over to
+    # disk or to reach its BytesIO, so _rolled and _file are read directly.
+    # Both have been part of its implementation since it was added.
+    @property
+    def in_memory(self) -> bool:
+        return not self.stream._rolled
+
+    def memoryview(self) -> memoryview:
+        # The view exports the BytesIO buffer (or the mmap), which cannot be
+        # resized or closed until the view is released.
+        if self.in_memory:
+            return self.stream._file.getbuffer().toreadonly()
+        if self.size == 0:
+            return memoryview(b"")
+        return memoryview(self.mmap())
+
+    @contextmanager
+    def buffer(self) -> Iterator[memoryview]:
+        if self.in_memory or self.size == 0:
+            with self.memoryview() as view:
+                yield view
+            return
+        with self.mmap() as mapped, memoryview(mapped) as view:
+            yield view
+
+    def mmap(self) -> mmap.mmap:
+        if self.in_memory:
+            raise ValueError("Upload is held in memory, use memoryview() instead")
+        return mmap.mmap(self.stream.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class StreamingMultiPartParser(MultiPartParser):
+    def __init__(
+        self, limits: Dict[str, FileLimit], spool_threshold: int, **kwargs: Any
+    ) -> None:
+        super().__init__(**kwargs)
+        self.limits = limits
+        self.spool_threshold = spool_threshold
+
+    def start_file_streaming(
+        self, event: File, total_content_length: Optional[int]
+    ) -> IO[bytes]:
+        limit = self.limits.get(event.name)
+        if limit is None:
+            return UploadSpool(self.spool_threshold)  # type: ignore[return-value]
+        content_type = event.headers.get("content-type")
+        if limit.content_types is not None and not content_type_allowed(
+            content_type, limit.content_types
+        ):
+            expected = ", ".join(limit.content_types)
+            raise RequestValidationError(
+                [
+                    {
+                        "type": "file_content_type",
+                        "loc": limit.loc,
+                        "msg": f"File content type should be one of: {expected}",
+                        "input": content_type,
+                        "ctx": {"expected": expected},
+                    }
+                ]
+            )
+        return UploadSpool(  # type: ignore[return-value]
+            self.spool_threshold, limit.max_bytes, limit.digests, limit.sniff
+        )
+
+
+# Overrides the private FormDataParser._parse_multipart hook, which is why
+# requirements.txt pins the Werkzeug versions this was tested against.
+class StreamingFormDataParser(FormDataParser):
+    def __init__(
+        self, limits: Dict[str, FileLimit], spool_threshold: int, **kwargs: Any
+    ) -> None:
+        super().__init__(**kwargs)
+        self.limits = limits
+        self.spool_threshold = spool_threshold
+
+    def _parse_multipart(
+        self,
+        stream: IO[bytes],
+        mimetype: str,
+        content_length: Optional[int],
+        options: Dict[str, str],
+    ) -> Any:
+        parser = StreamingMultiPartParser(
+            self.limits,
+            self.spool_threshold,
+            max_form_memory_size=self.max_form_memory_size,
+            max_form_parts=self.max_form_parts,
+            cls=self.cls,
+        )
+        boundary = options.get("boundary", "").encode("ascii")
+        if not boundary:
+            raise ValueError("Missing boundary")
+        form, files = parser.parse(stream, boundary, content_length)
+        uploads = self.cls(
+            (
+                key,
+                UploadedFile(
+                    file.stream, file.filename, file.name, headers=file.headers
+                ),
+            )
+            for key, file in files.items(multi=True)
+        )
+        return stream, form, uploads
@@ -1,8 +1,9 @@
-from typing import Any, Optional
+from typing import Any, Literal, Optional, Sequence
 
 from pydantic_core import PydanticUndefined
 
 from flask_request_data_validator import _params
+from flask_request_data_validator.bulk import DEFAULT_BULK_MIN_BYTES
 
 
 def Path(
@@ -132,6 +133,11 @@ def Body(
     *,
     embed: bool = False,
     media_type: str = "application/json",
+    max_bytes: Optional[int] = None,
+    bulk_chunk_size: Optional[int] = None,
+    bulk_min_bytes: int = DEFAULT_BULK_MIN_BYTES,
+    partial: bool = False,
+    stream: Optional[Literal["ndjson", "json"]] = None,
     alias: Optional[str] = None,
     title: Optional[str] = None,
     description: Optional[str] = None,
@@ -147,6 +153,11 @@ def Body(
         default=default,
         embed=embed,
         media_type=media_type,
+        max_bytes=max_bytes,
+        bulk_chunk_size=bulk_chunk_size,
+        bulk_min_bytes=bulk_min_bytes,
+        partial=partial,
+        stream=stream,
         alias=alias,
         title=title,
         description=description,
@@ -164,6 +175,7 @@ def Form(
     default: Any = PydanticUndefined,
     *,
     media_type: str = "application/x-www-form-urlencoded",
+    max_bytes: Optional[int] = None,
     alias: Optional[str] = None,
     title: Optional[str] = None,
     description: Optional[str] = None,
@@ -179,6 +191,7 @@ def Form(
         default,
         embed=True,
         media_type=media_type,
+        max_bytes=max_bytes,
         alias=alias,
         title=title,
         description=description,
@@ -196,6 +209,10 @@ def File(
     default: Any = PydanticUndefined,
     *,
     media_type: str = "multipart/form-data",
+    max_bytes: Optional[int] = None,
+    content_types: Optional[Sequence[str]] = None,
+    digests: Optional[Sequence[str]] = None,
+    sniff: bool = False,
     alias: Optional[str] = None,
     title: Optional[str] = None,
     description: Optional[str] = None,
@@ -211,6 +228,10 @@ def File(
         default,
         embed=True,
         media_type=media_type,
+        max_bytes=max_bytes,
+        content_types=content_types,
+        digests=digests,
+        sniff=sniff,
         alias=alias,
         title=title,
         description=description,
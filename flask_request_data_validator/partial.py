@@ -0,0 +1,32 @@
+from typing import Generic, Iterator, List, TypeVar
+
+from pydantic_core import ErrorDetails
+
+T = TypeVar("T")
+
+
+class PartialResult(Generic[T]):
+    __slots__ = ("items", "indexes", "errors")
+
+    def __init__(
+        self, items: List[T], indexes: List[int], errors: List[ErrorDetails]
+    ) -> None:
+        self.items = items
+        self.indexes = indexes
+        self.errors = errors
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(items={len(self.items)}, "
+            f"errors={len(self.errors)})"
+        )
@@ -0,0 +1,148 @@
+import collections.abc
+import logging
+import random
+from typing import Annotated, Any, Optional, Tuple, get_args, get_origin
+
+from flask import Response, current_app, has_app_context, has_request_context, request
+from pydantic import BaseModel, TypeAdapter
+from pydantic.fields import FieldInfo
+from pydantic_core import ValidationError
+
+from flask_request_data_validator._params import IncEx, type_adapter_registry
+from flask_request_data_validator.body_parsers import MSGPACK_MEDIA_TYPE, msgpack
+from flask_request_data_validator.exceptions import ResponseValidationError
+from flask_request_data_validator.utils import lenient_issubclass
+
+logger = logging.getLogger("flask_request_data_validator")
+
+_LIST_ORIGINS = (list, collections.abc.Sequence)
+
+
+def _model_type(annotation: Any) -> Tuple[Optional[type], bool]:
+    if get_origin(annotation) is Annotated:
+        annotation = get_args(annotation)[0]
+    if lenient_issubclass(annotation, BaseModel):
+        return annotation, False
+    args = get_args(annotation)
+    if get_origin(annotation) in _LIST_ORIGINS and args:
+        if lenient_issubclass(args[0], BaseModel):
+            return args[0], True
+    return None, False
+
+
+class ResponseModel:
+    def __init__(
+        self,
+        annotation: Any,
+        *,
+        include: Optional[IncEx] = None,
+        exclude: Optional[IncEx] = None,
+        by_alias: bool = True,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+        validation_rate: Optional[float] = None,
+        msgpack: bool = False,
+    ) -> None:
+        if validation_rate is not None and not 0 <= validation_rate <= 1:
+            raise ValueError("validation_rate must be between 0 and 1")
+        self.msgpack = msgpack
+        self.annotation = annotation
+        self.validation_rate = validation_rate
+        self._field_info = FieldInfo.from_annotation(annotation)
+        self._dump_options = {
+            "include": include,
+            "exclude": exclude,
+            "by_alias": by_alias,
+            "exclude_unset": exclude_unset,
+            "exclude_defaults": exclude_defaults,
+            "exclude_none": exclude_none,
+        }
+        self._type_adapter: Optional[TypeAdapter[Any]] = None
+        self._model, self._model_list = _model_type(annotation)
+
+    @property
+    def type_adapter(self) -> TypeAdapter[Any]:
+        if self._type_adapter is None:
+            self._type_adapter = type_adapter_registry.get(self._field_info)
+        return self._type_adapter
+
+    def is_instance(self, value: Any) -> bool:
+        if self._model is None:
+            return False
+        if self._model_list:
+            return isinstance(value, list) and all(
+                isinstance(item, self._model) for item in value
+            )
+        return isinstance(value, self._model)
+
+    def serialize(self, value: Any, media_type: str = "application/json") -> bytes:
+        try:
+            value = self.type_adapter.validate_python(value, from_attributes=True)
+        except ValidationError as exc:
+            raise ResponseValidationError(exc.errors(include_url=False))
+        return self._dump(value, media_type)
+
+    def serialize_sampled(
+        self, value: Any, rate: float, media_type: str = "application/json"
+    ) -> bytes:
+        sampled = rate and (rate >= 1 or random.random() < rate)
+        if not sampled and self.is_instance(value):
+            return self._dump(value, media_type)
+        try:
+            return self.serialize(value, media_type)
+        except ResponseValidationError as exc:
+            logger.warning(
+                "Response does not match %r: %s", self.annotation, exc.errors
+            )
+        return self._dump(value, media_type, warnings=False)
+
+    def _dump(self, value: Any, media_type: str, warnings: bool = True) -> bytes:
+        if media_type == MSGPACK_MEDIA_TYPE:
+            return msgpack.packb(
+                self.type_adapter.dump_python(
+                    value, mode="json", warnings=warnings, **self._dump_options
+                )
+            )
+        return self.type_adapter.dump_json(
+            value, warnings=warnings, **self._dump_options
+        )
+
+    def get_media_type(self) -> str:
+        if not self.msgpack or not has_request_context():
+            return "application/json"
+        best = request.accept_mimetypes.best_match(
+            ("application/json", MSGPACK_MEDIA_TYPE)
+        )
+        return best or "application/json"
+
+    def get_validation_rate(self) -> Optional[float]:
+        if self.validation_rate is not None:
+            return self.validation_rate
+        if has_app_context():
+            return current_app.config.get("RESPONSE_VALIDATION_RATE")
+        return None
+
+    def make_response(self, rv: Any) -> Any:
+        if isinstance(rv, Response):
+            return rv
+        if isinstance(rv, tuple):
+            if isinstance(rv[0], Response):
+                return rv
+            return (self._make_response(rv[0]), *rv[1:])
+        return self._make_response(rv)
+
+    def _make_response(self, value: Any) -> Response:
+        media_type = self.get_media_type()
+        rate = self.get_validation_rate()
+        if rate is None:
+            body = self.serialize(value, media_type)
+        else:
+            body = self.serialize_sampled(value, rate, media_type)
+        response = Response(body, mimetype=media_type)
+        if self.msgpack:
+            response.vary.add("Accept")
+        return response
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.annotation!r})"
@@ -0,0 +1,175 @@
+import codecs
+import json
+import re
+from typing import IO, Any, Dict, Iterator, List, Tuple
+
+from pydantic import TypeAdapter
+from pydantic_core import ValidationError
+
+from flask_request_data_validator.exceptions import RequestValidationError
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+# Longest token a decode error can point back over when the element is cut
+# at the end of the buffer (e.g. a partial "\ud83d\ude00" escape pair).
+_TRUNCATION_MARGIN = 12
+
+
+def _json_invalid(loc: Tuple[Any, ...], msg: str, pos: int) -> RequestValidationError:
+    error: Dict[str, Any] = {
+        "type": "json_invalid",
+        "loc": loc + (pos,),
+        "msg": "JSON decode error",
+        "input": {},
+        "ctx": {"error": msg},
+    }
+    return RequestValidationError([error])
+
+
+def _item_errors(
+    exc: ValidationError, loc: Tuple[Any, ...], index: int
+) -> RequestValidationError:
+    return RequestValidationError(
+        [{**error, "loc": loc + (index, *error["loc"])} for error in exc.errors()]
+    )
+
+
+def _iter_lines(stream: IO[bytes], chunk_size: int) -> Iterator[bytes]:
+    # Request streams are unbuffered, so iterating them directly reads one byte
+    # per call; read whole chunks and split them instead.
+    parts: List[bytes] = []
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        lines = chunk.split(b"\n")
+        if len(lines) > 1:
+            parts.append(lines[0])
+            lines[0] = b"".join(parts)
+            parts = []
+            yield from lines[:-1]
+        parts.append(lines[-1])
+    tail = b"".join(parts)
+    if tail:
+        yield tail
+
+
+def iter_ndjson(
+    stream: IO[bytes],
+    type_adapter: TypeAdapter[Any],
+    loc: Tuple[str, ...],
+    chunk_size: int = 64 * 1024,
+) -> Iterator[Any]:
+    for line_number, line in enumerate(_iter_lines(stream, chunk_size), 1):
+        if not line.strip():
+            continue
+        try:
+            yield type_adapter.validate_json(line)
+        except ValidationError as exc:
+            raise _item_errors(exc, loc, line_number)
+
+
+class _TextReader:
+    def __init__(
+        self, stream: IO[bytes], loc: Tuple[Any, ...], chunk_size: int
+    ) -> None:
+        self.stream = stream
+        self.loc = loc
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.offset = 0
+        self.eof = False
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+
+    @property
+    def position(self) -> int:
+        return self.offset + self.pos
+
+    def fill(self, size: int) -> None:
+        data = self.stream.read(size)
+        try:
+            text = self._decoder.decode(data, final=not data)
+        except UnicodeDecodeError as exc:
+            pos = self.offset + len(self.buffer)
+            pos += len(exc.object[: exc.start].decode("utf-8"))
+            raise _json_invalid(self.loc, f"Invalid UTF-8: {exc.reason}", pos)
+        self.eof = not data
+        self.offset += self.pos
+        self.buffer = self.buffer[self.pos :] + text
+        self.pos = 0
+
+    def peek(self) -> str:
+        while self.pos >= len(self.buffer) and not self.eof:
+            self.fill(self.chunk_size)
+        return self.buffer[self.pos : self.pos + 1]
+
+    def skip_whitespace(self) -> None:
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()  # type: ignore
+            if self.pos < len(self.buffer) or self.eof:
+                return
+            self.fill(self.chunk_size)
+
+    def _truncated(self, exc: json.JSONDecodeError) -> bool:
+        return exc.pos >= len(self.buffer) - _TRUNCATION_MARGIN or exc.msg.startswith(
+            "Unterminated string"
+        )
+
+    def decode(self) -> Any:
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as exc:
+                if self.eof or not self._truncated(exc):
+                    raise _json_invalid(self.loc, exc.msg, self.offset + exc.pos)
+            else:
+                # A number at the end of the buffer may continue in the next read.
+                if self.eof or (
+                    end < len(self.buffer)
+                    and (
+                        not isinstance(value, (int, float))
+                        or self.buffer[end] not in _NUMBER_CHARS
+                    )
+                ):
+                    self.pos = end
+                    return value
+            self.fill(max(self.chunk_size, len(self.buffer) - self.pos))
+
+
+def iter_json_array(
+    stream: IO[bytes],
+    type_adapter: TypeAdapter[Any],
+    loc: Tuple[str, ...],
+    chunk_size: int = 64 * 1024,
+) -> Iterator[Any]:
+    reader = _TextReader(stream, loc, chunk_size)
+    reader.skip_whitespace()
+    if reader.peek() != "[":
+        raise _json_invalid(loc, "Expecting '['", reader.position)
+    reader.pos += 1
+    reader.skip_whitespace()
+    if reader.peek() == "]":
+        reader.pos += 1
+    else:
+        index = 0
+        while True:
+            value = reader.decode()
+            try:
+                yield type_adapter.validate_python(value)
+            except ValidationError as exc:
+                raise _item_errors(exc, loc, index)
+            index += 1
+            reader.skip_whitespace()
+            char = reader.peek()
+            if char == "]":
+                reader.pos += 1
+                break
+            if char != ",":
+                raise _json_invalid(loc, "Expecting ',' delimiter", reader.position)
+            reader.pos += 1
+            reader.skip_whitespace()
+    reader.skip_whitespace()
+    if reader.peek():
+        raise _json_invalid(loc, "Extra data", reader.position)
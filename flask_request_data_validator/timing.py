@@ -0,0 +1,105 @@
+import logging
+import threading
+from time import perf_counter
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+TimingSink = Callable[[str, str, float], None]
+
+_timing_sink: Optional[TimingSink] = None
+
+
+def set_timing_sink(sink: Optional[TimingSink]) -> None:
+    global _timing_sink
+    _timing_sink = sink
+
+
+def get_timing_sink() -> Optional[TimingSink]:
+    return _timing_sink
+
+
+class PhaseTimer:
+    __slots__ = ("sink", "endpoint", "_start")
+
+    def __init__(self, sink: TimingSink, endpoint: str) -> None:
+        self.sink = sink
+        self.endpoint = endpoint
+        self._start = perf_counter()
+
+    def restart(self) -> None:
+        self._start = perf_counter()
+
+    def lap(self, phase: str) -> None:
+        now = perf_counter()
+        self.sink(self.endpoint, phase, now - self._start)
+        self._start = now
+
+
+class PhaseStats:
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(count={self.count}, "
+            f"total={self.total:.6f}, max={self.max:.6f})"
+        )
+
+
+class TimingStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], PhaseStats] = {}
+
+    def __call__(self, endpoint: str, phase: str, seconds: float) -> None:
+        with self._lock:
+            stats = self._stats.get((endpoint, phase))
+            if stats is None:
+                stats = self._stats[(endpoint, phase)] = PhaseStats()
+            stats.add(seconds)
+
+    def get(self, endpoint: str, phase: str) -> Optional[PhaseStats]:
+        return self._stats.get((endpoint, phase))
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        result: Dict[str, Dict[str, Dict[str, float]]] = {}
+        with self._lock:
+            for (endpoint, phase), stats in self._stats.items():
+                result.setdefault(endpoint, {})[phase] = {
+                    "count": stats.count,
+                    "total": stats.total,
+                    "mean": stats.mean,
+                    "max": stats.max,
+                }
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+class LoggingTimingSink:
+    def __init__(
+        self,
+        logger: Optional[Union[logging.Logger, "logging.LoggerAdapter[Any]"]] = None,
+        level: int = logging.DEBUG,
+    ) -> None:
+        self.logger = logger or logging.getLogger("flask_request_data_validator")
+        self.level = level
+
+    def __call__(self, endpoint: str, phase: str, seconds: float) -> None:
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, "%s %s %.3fms", endpoint, phase, seconds * 1000)
@@ -1,3 +1,4 @@
+import io
 import json
 import types
 from collections import deque
@@ -5,6 +6,7 @@ from dataclasses import is_dataclass
 from typing import (
     Annotated,
     Any,
+    BinaryIO,
     Deque,
     FrozenSet,
     List,
@@ -21,16 +23,43 @@ from pydantic import BaseModel
 from pydantic._internal._utils import lenient_issubclass as lenient_issubclass
 from werkzeug.datastructures import FileStorage
 
+from flask_request_data_validator.exceptions import RequestEntityTooLarge
+
 UnionType = getattr(types, "UnionType", Union)
 
+# Errors that validate_json reports differently from the Python path (or that
+# it cannot locate); bodies with any of them are validated again from Python.
+PYTHON_ERROR_TYPES = frozenset({"json_invalid", "model_type", "dataclass_type"})
+
 
 class ResponseEncoder(json.JSONEncoder):
-    def default(self, o: Any) -> str:
+    def default(self, o: Any) -> Any:
         if isinstance(o, bytes):
             return o.decode()
+        if isinstance(o, BaseModel):
+            return o.model_dump(mode="json")
         return super().encode(o)
 
 
+class BoundedStream(io.RawIOBase):
+    def __init__(self, stream: BinaryIO, max_bytes: int) -> None:
+        self._stream = stream
+        self._max_bytes = max_bytes
+        self._read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._stream.read(len(buffer))
+        size = len(data)
+        self._read += size
+        if self._read > self._max_bytes:
+            raise RequestEntityTooLarge(self._max_bytes)
+        buffer[:size] = data
+        return size
+
+
 sequence_annotation_to_type = {
     Sequence: list,
     List: list,
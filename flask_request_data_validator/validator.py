@@ -1,37 +1,110 @@
+import asyncio
+import contextvars
+import gc
 import inspect
 import json
-from functools import update_wrapper
+from functools import partial, update_wrapper, wraps
+from operator import itemgetter
 from typing import (
     Annotated,
     Any,
     Callable,
     Dict,
     List,
+    Optional,
     Tuple,
     Union,
     get_args,
     get_origin,
 )
 
-from flask import request
+from flask import Flask, request
 from pydantic import BaseModel
 from pydantic_core import ErrorDetails, PydanticUndefined
 from werkzeug.datastructures import FileStorage, Headers, MultiDict
 
-from flask_request_data_validator import _params
-from flask_request_data_validator.dependant import Dependant
+from flask_request_data_validator import _params, body_parsers
+from flask_request_data_validator._params import IncEx
+from flask_request_data_validator.body_parsers import BodyParser, parse_json
+from flask_request_data_validator.concurrency import (
+    DEFAULT_OFFLOAD_THRESHOLD,
+    get_bulk_executor,
+    get_offload_executor,
+)
+from flask_request_data_validator.dependant import Dependant, FieldPlan
 from flask_request_data_validator.exception_handlers import exception_handler
 from flask_request_data_validator.exceptions import (
     InternalServerError,
+    RequestEntityTooLarge,
     RequestValidationError,
+    ResponseValidationError,
+)
+from flask_request_data_validator.multipart import (
+    DEFAULT_SPOOL_THRESHOLD,
+    StreamingFormDataParser,
+)
+from flask_request_data_validator.response_model import ResponseModel
+from flask_request_data_validator.streaming import iter_json_array, iter_ndjson
+from flask_request_data_validator.timing import (
+    PhaseTimer,
+    TimingSink,
+    get_timing_sink,
 )
+from flask_request_data_validator.utils import BoundedStream
+
+
+def _receive_headers() -> Headers:
+    return request.headers
+
+
+def _receive_path() -> Dict[str, Any]:
+    return request.view_args or {}
+
+
+def _receive_query() -> MultiDict[str, Any]:
+    return request.args or MultiDict()
+
+
+def _receive_files() -> MultiDict[str, FileStorage]:
+    return request.files or MultiDict()
+
+
+def _receive_cookies() -> MultiDict[str, str]:
+    return request.cookies or MultiDict()
 
 
 class ParameterValidator:
-    def __init__(self, call: Callable[..., Any]) -> None:
+    def __init__(
+        self,
+        call: Callable[..., Any],
+        *,
+        combined_validation: bool = False,
+        max_bytes: Optional[int] = None,
+        timing_sink: Optional[TimingSink] = None,
+        fail_fast: bool = False,
+        response_model: Optional[ResponseModel] = None,
+        offload_threshold: Optional[int] = DEFAULT_OFFLOAD_THRESHOLD,
+        spool_threshold: int = DEFAULT_SPOOL_THRESHOLD,
+        msgpack: bool = False,
+    ) -> None:
+        if fail_fast and combined_validation:
+            raise ValueError("fail_fast cannot be used with combined_validation")
+        if msgpack and body_parsers.msgpack is None:
+            raise ValueError("msgpack=True requires the msgpack package")
+        self.msgpack = msgpack
         self._call = call
         update_wrapper(self, call)
+        self.combined_validation = combined_validation
+        self.fail_fast = fail_fast
+        self.response_model = response_model
+        self.offload_threshold = offload_threshold
+        self.spool_threshold = spool_threshold
+        self.timing_sink = timing_sink
         self.dependant: Dependant = self._get_dependant()
+        self.max_bytes = self._get_max_bytes(max_bytes)
+        self._sources: List[Tuple[str, Callable[[], Any], List[FieldPlan]]] = (
+            self._get_sources()
+        )
 
     def _update_field_info(
         self, field: _params.FieldAdapter, param_name: str, param: inspect.Parameter
@@ -98,85 +171,423 @@ class ParameterValidator:
                 param=param,
                 field=field,
             )
+        dependant.compile(combined=self.combined_validation, msgpack=self.msgpack)
         return dependant
 
-    def _solve_dependencies(
+    def _get_max_bytes(self, max_bytes: Optional[int]) -> Optional[int]:
+        if not self.dependant.body_params and not self.dependant.file_params:
+            return None
+        limits = [
+            field.max_bytes
+            for field in self.dependant.body_params.values()
+            if field.max_bytes is not None
+        ]
+        if max_bytes is not None:
+            limits.append(max_bytes)
+        return min(limits) if limits else None
+
+    def _limit_body(self, max_bytes: int) -> None:
+        content_length = request.content_length
+        if content_length is not None:
+            if content_length > max_bytes:
+                raise RequestEntityTooLarge(max_bytes)
+            return
+        environ = request.environ
+        environ["wsgi.input"] = BoundedStream(environ["wsgi.input"], max_bytes)
+
+    def _load_multipart(self) -> None:
+        # Uses Request._get_stream_for_parsing and fills the cached form/files
+        # properties directly; requirements.txt pins the Werkzeug range for it.
+        if "form" in request.__dict__ or request.mimetype != "multipart/form-data":
+            return
+        parser = StreamingFormDataParser(
+            self.dependant.file_limits,
+            self.spool_threshold,
+            max_form_memory_size=request.max_form_memory_size,
+            max_content_length=request.max_content_length,
+            max_form_parts=request.max_form_parts,
+            cls=request.parameter_storage_class,
+        )
+        data = parser.parse(
+            request._get_stream_for_parsing(),
+            request.mimetype,
+            request.content_length,
+            request.mimetype_params,
+        )
+        d = request.__dict__
+        d["stream"], d["form"], d["files"] = data
+
+    def _receive_files(self) -> MultiDict[str, FileStorage]:
+        self._load_multipart()
+        return _receive_files()
+
+    def _get_sources(self) -> List[Tuple[str, Callable[[], Any], List[FieldPlan]]]:
+        if self.fail_fast:
+            # Cheapest first: files need the request body to be parsed.
+            sources = [
+                ("path", _receive_path, self.dependant.path_plans),
+                ("header", _receive_headers, self.dependant.header_plans),
+                ("query", _receive_query, self.dependant.query_plans),
+                ("cookie", _receive_cookies, self.dependant.cookie_plans),
+                ("file", self._receive_files, self.dependant.file_plans),
+            ]
+        else:
+            sources = [
+                ("header", _receive_headers, self.dependant.header_plans),
+                ("path", _receive_path, self.dependant.path_plans),
+                ("query", _receive_query, self.dependant.query_plans),
+                ("file", self._receive_files, self.dependant.file_plans),
+                ("cookie", _receive_cookies, self.dependant.cookie_plans),
+            ]
+        return [source for source in sources if source[2]]
+
+    def _read_body(self) -> bytes:
+        return request.get_data(parse_form_data=True)
+
+    def _parse_body(
+        self, body: bytes, parser: BodyParser
+    ) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        if not body and not request.mimetype:
+            return None, None
+        try:
+            received_body = parser(request, body)
+        except json.JSONDecodeError as e:
+            return None, {
+                "type": "json_invalid",
+                "loc": ("body", e.pos),
+                "msg": "JSON decode error",
+                "input": {},
+                "ctx": {"error": e.msg},
+            }
+        except (ValueError, LookupError) as e:
+            return None, {
+                "type": "body_decode",
+                "loc": ("body",),
+                "msg": f"Body could not be decoded as {request.mimetype}",
+                "input": {},
+                "ctx": {"error": str(e)},
+            }
+        if received_body is None and body:
+            received_body = body
+        return received_body, None
+
+    def _solve_bulk_body(
+        self, body: bytes
+    ) -> Optional[
+        Tuple[Dict[str, BaseModel], List[Union[Dict[str, Any], ErrorDetails]]]
+    ]:
+        result = self.dependant.bulk_validator.validate(  # type: ignore
+            body, get_bulk_executor
+        )
+        if result is None:
+            return None
+        items, errors = result
+        if errors:
+            return {}, errors
+        return {self.dependant.body_plans[0].name: items}, []  # type: ignore
+
+    def _solve_stream_body(
         self,
+    ) -> Tuple[Dict[str, Any], List[Union[Dict[str, Any], ErrorDetails]]]:
+        plan: FieldPlan = self.dependant.stream_plan  # type: ignore[assignment]
+        field: _params.Body = plan.field  # type: ignore[assignment]
+        if not request.content_length and not request.environ.get(
+            "wsgi.input_terminated"
+        ):
+            if plan.required:
+                return {}, [plan.missing_error()]
+            return {plan.name: field.default}, []
+        if field.stream == "ndjson":
+            items = iter_ndjson(request.stream, field.item_type_adapter, plan.loc)
+        else:
+            items = iter_json_array(request.stream, field.item_type_adapter, plan.loc)
+        return {plan.name: items}, []
+
+    def _solve_body(
+        self, timer: Optional[PhaseTimer] = None
+    ) -> Tuple[Dict[str, BaseModel], List[Union[Dict[str, Any], ErrorDetails]]]:
+        if self.dependant.stream_plan is not None:
+            return self._solve_stream_body()
+        parser = self.dependant.get_body_parser(request.mimetype)
+        body = self._read_body()
+        if timer is not None:
+            timer.lap("body_read")
+        if body:
+            if parser is parse_json:
+                if self.dependant.bulk_validator is not None:
+                    result = self._solve_bulk_body(body)
+                    if timer is not None:
+                        timer.lap("body_validation")
+                    if result is not None:
+                        return result
+                solved = self.dependant.solve_json_body(body, self.fail_fast)
+                if timer is not None:
+                    timer.lap("body_validation")
+                if solved is not None:
+                    return solved
+
+        received_body, json_error = self._parse_body(body, parser)
+        if timer is not None:
+            timer.lap("json_parse")
+        if json_error is not None:
+            return {}, [json_error]
+        result = self.dependant.solve_body(received_body, self.fail_fast)
+        if timer is not None:
+            timer.lap("body_validation")
+        return result
+
+    def _solve_dependencies(
+        self, timer: Optional[PhaseTimer] = None
     ) -> Tuple[Dict[str, BaseModel], List[Union[Dict[str, Any], ErrorDetails]]]:
+        if self.max_bytes is not None:
+            self._limit_body(self.max_bytes)
+        if self.dependant.combined_validator is not None:
+            return self._solve_dependencies_combined(timer)
         solved_params: Dict[str, BaseModel] = {}
         errors: List[Union[Dict[str, Any], ErrorDetails]] = []
 
-        headers: Headers = request.headers
-        _params, _errors = self.dependant.solve_header_params(headers)
-        errors.extend(_errors)
-        solved_params.update(_params)
-
-        path: Dict[str, Any] = request.view_args or {}
-        _params, _errors = self.dependant.solve_path_params(path)
-        errors.extend(_errors)
-        solved_params.update(_params)
-
-        query: MultiDict[str, Any] = request.args or MultiDict()
-        _params, _errors = self.dependant.solve_query_params(query)
-        errors.extend(_errors)
-        solved_params.update(_params)
-
-        files: MultiDict[str, FileStorage] = request.files or MultiDict()
-        _params, _errors = self.dependant.solve_file_params(files)
-        errors.extend(_errors)
-        solved_params.update(_params)
-
-        cookies: MultiDict[str, str] = request.cookies or MultiDict()
-        _params, _errors = self.dependant.solve_cookie_params(cookies)
-        errors.extend(_errors)
-        solved_params.update(_params)
-
-        if self.dependant.body_params:
-            received_body: Union[Dict[str, str], bytes, None] = None
-            if self.dependant.is_form_type:
-                received_body = dict(request.form)
-            else:
-                body_bytes = request.get_data()
-                if body_bytes and not request.content_type or request.is_json:
-                    json_body = request.get_json(silent=True)
-                    if json_body is not None:
-                        received_body = json_body
-                    else:
-                        try:
-                            json_body = json.loads(body_bytes.decode())
-                            received_body = json_body
-                        except json.JSONDecodeError as e:
-                            validation_error = {
-                                "type": "json_invalid",
-                                "loc": ("body", e.pos),
-                                "msg": "JSON decode error",
-                                "input": {},
-                                "ctx": {"error": e.msg},
-                            }
-                            errors.append(validation_error)
-                            return solved_params, errors
-                if received_body is None and body_bytes:
-                    received_body = body_bytes
-
-            _params, _errors = self.dependant.solve_body(received_body)
+        for phase, receive, plans in self._sources:
+            _params, _errors = self.dependant.solve_params(
+                receive(), plans, self.fail_fast
+            )
+            errors.extend(_errors)
+            solved_params.update(_params)
+            if timer is not None:
+                timer.lap(phase)
+            if self.fail_fast and errors:
+                return solved_params, errors
+
+        if self.dependant.body_plans:
+            _params, _errors = self._solve_body(timer)
             errors.extend(_errors)
             solved_params.update(_params)
         return solved_params, errors
 
+    def _solve_dependencies_combined(
+        self, timer: Optional[PhaseTimer] = None
+    ) -> Tuple[Dict[str, BaseModel], List[Union[Dict[str, Any], ErrorDetails]]]:
+        inputs: Dict[str, Any] = {}
+        solved_params: Dict[str, Any] = {}
+        indexed_errors: List[Tuple[int, Union[Dict[str, Any], ErrorDetails]]] = []
+
+        for phase, receive, plans in self._sources:
+            self.dependant.gather_params(
+                receive(), plans, inputs, solved_params, indexed_errors
+            )
+            if timer is not None:
+                timer.lap(phase)
+
+        json_error = None
+        if self.dependant.body_plans:
+            parser = self.dependant.get_body_parser(request.mimetype)
+            body = self._read_body()
+            if timer is not None:
+                timer.lap("body_read")
+            received_body, json_error = self._parse_body(body, parser)
+            if timer is not None:
+                timer.lap("json_parse")
+            if json_error is None:
+                self.dependant.gather_body(
+                    received_body, inputs, solved_params, indexed_errors
+                )
+
+        if inputs:
+            validated, _errors = self.dependant.combined_validator.validate(inputs)  # type: ignore
+            solved_params.update(validated)
+            indexed_errors.extend(_errors)
+            if timer is not None:
+                timer.lap("validation")
+        indexed_errors.sort(key=itemgetter(0))
+        errors = [error for _, error in indexed_errors]
+        if json_error is not None:
+            errors.append(json_error)
+        return solved_params, errors
+
+    def warmup(self) -> None:
+        self.dependant.warmup()
+        if self.response_model is not None:
+            self.response_model.type_adapter
+
+    def _handle_exception(
+        self, exc: Exception, timer: Optional[PhaseTimer] = None
+    ) -> Any:
+        if timer is not None:
+            timer.restart()
+        if isinstance(exc, RequestValidationError):
+            response = exception_handler[RequestValidationError](exc)
+        elif isinstance(exc, RequestEntityTooLarge):
+            response = exception_handler[RequestEntityTooLarge](exc)
+        elif isinstance(exc, ResponseValidationError):
+            response = exception_handler[ResponseValidationError](exc)
+        else:
+            response = exception_handler[InternalServerError](exc)
+        if timer is not None:
+            timer.lap("error_handling")
+        return response
+
+    def _make_timer(self) -> Optional[PhaseTimer]:
+        sink = self.timing_sink or get_timing_sink()
+        if sink is None:
+            return None
+        return PhaseTimer(sink, request.endpoint or "")
+
+    def _make_response(self, rv: Any, timer: Optional[PhaseTimer] = None) -> Any:
+        if self.response_model is None:
+            return rv
+        try:
+            rv = self.response_model.make_response(rv)
+        except ResponseValidationError as e:
+            return self._handle_exception(e, timer)
+        if timer is not None:
+            timer.lap("serialization")
+        return rv
+
+    def _should_offload(self) -> bool:
+        if self.offload_threshold is None or self.dependant.stream_plan is not None:
+            return False
+        if not self.dependant.body_plans and not self.dependant.file_plans:
+            return False
+        if request.environ.get("wsgi.input_terminated"):
+            return True
+        content_length = request.content_length
+        return content_length is not None and content_length > self.offload_threshold
+
     def __call__(self, *args, **kwargs):
+        timer = self._make_timer()
         try:
-            solved, errors = self._solve_dependencies()
+            solved, errors = self._solve_dependencies(timer)
             if errors:
                 raise RequestValidationError(errors)
-        except RequestValidationError as rve:
-            return exception_handler[RequestValidationError](rve)
         except Exception as e:
-            return exception_handler[InternalServerError](e)
-        return self._call(*args, **{**kwargs, **solved})
+            return self._handle_exception(e, timer)
+        try:
+            if timer is None:
+                rv = self._call(*args, **{**kwargs, **solved})
+            else:
+                timer.restart()
+                rv = self._call(*args, **{**kwargs, **solved})
+                timer.lap("view")
+        except (RequestValidationError, RequestEntityTooLarge) as e:
+            return self._handle_exception(e, timer)
+        return self._make_response(rv, timer)
+
+    async def async_call(self, *args, **kwargs):
+        timer = self._make_timer()
+        try:
+            if self._should_offload():
+                context = contextvars.copy_context()
+                solved, errors = await asyncio.get_running_loop().run_in_executor(
+                    get_offload_executor(),
+                    context.run,
+                    self._solve_dependencies,
+                    timer,
+                )
+            else:
+                solved, errors = self._solve_dependencies(timer)
+            if errors:
+                raise RequestValidationError(errors)
+        except Exception as e:
+            return self._handle_exception(e, timer)
+        try:
+            if timer is None:
+                rv = await self._call(*args, **{**kwargs, **solved})
+            else:
+                timer.restart()
+                rv = await self._call(*args, **{**kwargs, **solved})
+                timer.lap("view")
+        except (RequestValidationError, RequestEntityTooLarge) as e:
+            return self._handle_exception(e, timer)
+        return self._make_response(rv, timer)
 
     def __repr__(self):
         return repr(self._call)
 
 
-def parameter_validator(func):
-    return ParameterValidator(func)
+def parameter_validator(
+    func: Optional[Callable[..., Any]] = None,
+    *,
+    combined_validation: bool = False,
+    max_bytes: Optional[int] = None,
+    timing_sink: Optional[TimingSink] = None,
+    fail_fast: bool = False,
+    response_model: Any = None,
+    response_model_include: Optional[IncEx] = None,
+    response_model_exclude: Optional[IncEx] = None,
+    response_model_by_alias: bool = True,
+    response_model_exclude_unset: bool = False,
+    response_model_exclude_defaults: bool = False,
+    response_model_exclude_none: bool = False,
+    response_validation_rate: Optional[float] = None,
+    offload_threshold: Optional[int] = DEFAULT_OFFLOAD_THRESHOLD,
+    spool_threshold: int = DEFAULT_SPOOL_THRESHOLD,
+    msgpack: bool = False,
+) -> Any:
+    if func is None:
+        return partial(
+            parameter_validator,
+            combined_validation=combined_validation,
+            max_bytes=max_bytes,
+            timing_sink=timing_sink,
+            fail_fast=fail_fast,
+            response_model=response_model,
+            response_model_include=response_model_include,
+            response_model_exclude=response_model_exclude,
+            response_model_by_alias=response_model_by_alias,
+            response_model_exclude_unset=response_model_exclude_unset,
+            response_model_exclude_defaults=response_model_exclude_defaults,
+            response_model_exclude_none=response_model_exclude_none,
+            response_validation_rate=response_validation_rate,
+            offload_threshold=offload_threshold,
+            spool_threshold=spool_threshold,
+            msgpack=msgpack,
+        )
+    validator = ParameterValidator(
+        func,
+        combined_validation=combined_validation,
+        max_bytes=max_bytes,
+        timing_sink=timing_sink,
+        fail_fast=fail_fast,
+        response_model=(
+            ResponseModel(
+                response_model,
+                include=response_model_include,
+                exclude=response_model_exclude,
+                by_alias=response_model_by_alias,
+                exclude_unset=response_model_exclude_unset,
+                exclude_defaults=response_model_exclude_defaults,
+                exclude_none=response_model_exclude_none,
+                validation_rate=response_validation_rate,
+                msgpack=msgpack,
+            )
+            if response_model is not None
+            else None
+        ),
+        offload_threshold=offload_threshold,
+        spool_threshold=spool_threshold,
+        msgpack=msgpack,
+    )
+    if not inspect.iscoroutinefunction(func):
+        return validator
+
+    @wraps(func)
+    async def async_validator(*args, **kwargs):
+        return await validator.async_call(*args, **kwargs)
+
+    async_validator.__wrapped__ = validator  # type: ignore[attr-defined]
+    return async_validator
+
+
+def warmup(app: Flask, *, freeze: bool = False) -> int:
+    validators: List[ParameterValidator] = []
+    for view in app.view_functions.values():
+        while view is not None:
+            if isinstance(view, ParameterValidator):
+                validators.append(view)
+                break
+            view = getattr(view, "__wrapped__", None)
+    for validator in validators:
+        validator.warmup()
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    return len(validators)
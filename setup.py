@@ -25,6 +25,7 @@ setup(
     keywords="flask request data validator",
     packages=["flask_request_data_validator"],
     install_requires=list(get_install_requires()),
+    extras_require={"orjson": ["orjson"], "msgpack": ["msgpack"]},
     classifiers=[
         "Framework :: Flask",
         "Framework :: Pydantic :: 2",
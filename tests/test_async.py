@@ -0,0 +1,132 @@
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, List
+
+import pytest
+from flask import Flask, jsonify
+from pydantic import BaseModel
+
+from flask_request_data_validator import (
+    Path,
+    Query,
+    parameter_validator,
+    set_offload_executor,
+    warmup,
+)
+from tests.conftest import match_pydantic_error_url
+
+pytest.importorskip("asgiref")
+
+app = Flask(__name__)
+client = app.test_client()
+
+
+class Item(BaseModel):
+    name: str
+    tags: List[str] = []
+
+
+@app.get("/items/<item_id>")
+@parameter_validator
+async def read_item(item_id: Annotated[int, Path()], q: Annotated[str, Query()]):
+    await asyncio.sleep(0)
+    return jsonify({"item_id": item_id, "q": q})
+
+
+@app.post("/items")
+@parameter_validator(offload_threshold=1024, response_model=Item)
+async def create_item(item: Item):
+    return item, 201
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    def __init__(self) -> None:
+        super().__init__(max_workers=1, thread_name_prefix="recording")
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+@pytest.fixture
+def executor():
+    executor = RecordingExecutor()
+    set_offload_executor(executor)
+    yield executor
+    set_offload_executor(None)
+    executor.shutdown()
+
+
+def test_async_view():
+    response = client.get("/items/1?q=foo")
+    assert response.status_code == 200, response.text
+    assert response.get_json() == {"item_id": 1, "q": "foo"}
+
+
+def test_async_view_invalid():
+    response = client.get("/items/foo")
+    assert response.status_code == 422
+    assert response.get_json() == {
+        "detail": [
+            {
+                "type": "int_parsing",
+                "loc": ["path", "item_id"],
+                "msg": "Input should be a valid integer, unable to parse string as an integer",
+                "input": "foo",
+                "url": match_pydantic_error_url("int_parsing"),
+            },
+            {
+                "type": "missing",
+                "loc": ["query", "q"],
+                "msg": "Field required",
+                "input": None,
+                "url": match_pydantic_error_url("missing"),
+            },
+        ]
+    }
+
+
+def test_small_body_is_validated_inline(executor):
+    response = client.post("/items", json={"name": "Foo"})
+    assert response.status_code == 201
+    assert response.get_json() == {"name": "Foo", "tags": []}
+    assert executor.submitted == 0
+
+
+def test_large_body_is_offloaded(executor):
+    body = {"name": "Foo", "tags": ["tag"] * 500}
+    response = client.post("/items", json=body)
+    assert response.status_code == 201
+    assert response.get_json() == body
+    assert executor.submitted == 1
+
+
+def test_large_invalid_body_is_offloaded(executor):
+    response = client.post("/items", json={"name": 1, "tags": ["tag"] * 500})
+    assert response.status_code == 422
+    assert response.get_json()["detail"][0]["loc"] == ["body", "name"]
+    assert executor.submitted == 1
+
+
+def test_request_without_body_is_validated_inline(executor):
+    response = client.post("/items")
+    assert response.status_code == 422
+    assert executor.submitted == 0
+
+
+def test_chunked_body_is_offloaded(executor):
+    response = client.post(
+        "/items",
+        input_stream=io.BytesIO(b'{"name": "Foo"}'),
+        content_type="application/json",
+        environ_overrides={"wsgi.input_terminated": True},
+    )
+    assert response.status_code == 201, response.text
+    assert response.get_json() == {"name": "Foo", "tags": []}
+    assert executor.submitted == 1
+
+
+def test_warmup_finds_async_views():
+    assert warmup(app) == 2
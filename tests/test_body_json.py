@@ -0,0 +1,204 @@
+from typing import Annotated, List, Optional
+
+import pytest
+from flask import Flask, jsonify
+from pydantic import BaseModel
+
+from flask_request_data_validator import Body, parameter_validator
+from flask_request_data_validator import validator as validator_module
+from tests.conftest import match_pydantic_error_url
+
+app = Flask(__name__)
+client = app.test_client()
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+class Order(BaseModel):
+    item: Item
+    items: List[Item] = []
+
+
+@app.post("/item")
+@parameter_validator
+def create_item(item: Item):
+    return jsonify(item.model_dump())
+
+
+@app.post("/items")
+@parameter_validator
+def create_items(
+    item: Item,
+    count: Annotated[int, Body(ge=1)] = 1,
+    note: Annotated[Optional[str], Body()] = "none",
+):
+    return jsonify({"item": item.model_dump(), "count": count, "note": note})
+
+
+@app.post("/order")
+@parameter_validator
+def create_order(order: Order):
+    return jsonify(order.model_dump())
+
+
+@pytest.fixture
+def no_python_json(monkeypatch):
+    def parse_body(self, body, parser):
+        raise AssertionError("body should be validated from raw bytes")
+
+    monkeypatch.setattr(validator_module.ParameterValidator, "_parse_body", parse_body)
+
+
+@pytest.mark.parametrize(
+    "path,data,expected_response",
+    [
+        ("/item", {"name": "Foo", "price": "1.5"}, {"name": "Foo", "price": 1.5}),
+        (
+            "/items",
+            {"item": {"name": "Foo", "price": 2}, "note": None},
+            {"item": {"name": "Foo", "price": 2.0}, "count": 1, "note": "none"},
+        ),
+        (
+            "/items",
+            {"item": {"name": "Foo", "price": 2}, "count": "3", "extra": 1},
+            {"item": {"name": "Foo", "price": 2.0}, "count": 3, "note": "none"},
+        ),
+    ],
+)
+def test_valid_json_body_skips_python_parsing(
+    no_python_json, path, data, expected_response
+):
+    response = client.post(path, json=data)
+    assert response.status_code == 200, response.text
+    assert response.get_json() == expected_response
+
+
+@pytest.mark.parametrize(
+    "path,data,expected_response",
+    [
+        (
+            "/item",
+            "null",
+            [
+                {
+                    "type": "model_attributes_type",
+                    "loc": ["body"],
+                    "msg": "Input should be a valid dictionary or object to extract fields from",
+                    "input": "null",
+                    "url": match_pydantic_error_url("model_attributes_type"),
+                }
+            ],
+        ),
+        (
+            "/item",
+            "[1]",
+            [
+                {
+                    "type": "model_attributes_type",
+                    "loc": ["body"],
+                    "msg": "Input should be a valid dictionary or object to extract fields from",
+                    "input": [1],
+                    "url": match_pydantic_error_url("model_attributes_type"),
+                }
+            ],
+        ),
+        (
+            "/items",
+            '{"item": null, "count": 0}',
+            [
+                {
+                    "type": "missing",
+                    "loc": ["body", "item"],
+                    "msg": "Field required",
+                    "input": None,
+                    "url": match_pydantic_error_url("missing"),
+                },
+                {
+                    "type": "greater_than_equal",
+                    "loc": ["body", "count"],
+                    "msg": "Input should be greater than or equal to 1",
+                    "input": 0,
+                    "ctx": {"ge": 1},
+                    "url": match_pydantic_error_url("greater_than_equal"),
+                },
+            ],
+        ),
+    ],
+)
+def test_invalid_json_body_keeps_error_locations(path, data, expected_response):
+    response = client.post(
+        path, data=data, headers={"content-type": "application/json"}
+    )
+    assert response.status_code == 422, response.text
+    assert response.get_json() == {"detail": expected_response}
+
+
+@pytest.mark.parametrize(
+    "path,data,expected_locs",
+    [
+        ("/item", {"name": 1, "price": "x"}, [["body", "name"], ["body", "price"]]),
+        (
+            "/items",
+            {"item": {"name": "Foo"}, "count": 0, "note": 1},
+            [["body", "item", "price"], ["body", "count"], ["body", "note"]],
+        ),
+        ("/items", {"count": 2}, [["body", "item"]]),
+    ],
+)
+def test_invalid_json_body_skips_python_parsing(
+    no_python_json, path, data, expected_locs
+):
+    response = client.post(path, json=data)
+    assert response.status_code == 422, response.text
+    detail = response.get_json()["detail"]
+    assert [error["loc"] for error in detail] == expected_locs
+
+
+def test_missing_embedded_field_matches_python_error(no_python_json):
+    response = client.post("/items", json={"count": 2})
+    assert response.get_json() == {
+        "detail": [
+            {
+                "type": "missing",
+                "loc": ["body", "item"],
+                "msg": "Field required",
+                "input": None,
+                "url": match_pydantic_error_url("missing"),
+            }
+        ]
+    }
+
+
+def model_attributes_error(loc, input):
+    return {
+        "type": "model_attributes_type",
+        "loc": loc,
+        "msg": "Input should be a valid dictionary or object to extract fields from",
+        "input": input,
+        "url": match_pydantic_error_url("model_attributes_type"),
+    }
+
+
+@pytest.mark.parametrize(
+    "path,data,expected_response",
+    [
+        ("/order", {"item": 5}, [model_attributes_error(["body", "item"], 5)]),
+        ("/order", {"item": None}, [model_attributes_error(["body", "item"], None)]),
+        (
+            "/order",
+            {"item": {"name": "Foo", "price": 1}, "items": [1, "x"]},
+            [
+                model_attributes_error(["body", "items", 0], 1),
+                model_attributes_error(["body", "items", 1], "x"),
+            ],
+        ),
+        ("/items", {"item": 5}, [model_attributes_error(["body", "item"], 5)]),
+    ],
+)
+def test_nested_non_object_keeps_python_error_payload(path, data, expected_response):
+    response = client.post(path, json=data)
+    assert response.status_code == 422, response.text
+    assert response.get_json() == {"detail": expected_response}
@@ -0,0 +1,197 @@
+import csv
+import io
+from typing import Annotated, List
+
+import pytest
+from flask import Flask, jsonify
+from pydantic import BaseModel
+
+from flask_request_data_validator import (
+    Body,
+    Form,
+    parameter_validator,
+    register_body_parser,
+)
+from flask_request_data_validator.body_parsers import (
+    body_parsers,
+    parse_bytes,
+    parse_json,
+    parse_text,
+    resolve_body_parser,
+)
+
+app = Flask(__name__)
+client = app.test_client()
+
+
+def parse_csv(request, body):
+    return list(csv.DictReader(io.StringIO(body.decode())))
+
+
+register_body_parser("text/csv", parse_csv)
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+@app.post("/text")
+@parameter_validator
+def post_text(text: Annotated[str, Body(media_type="text/plain")]):
+    return jsonify({"text": text})
+
+
+@app.post("/bytes")
+@parameter_validator
+def post_bytes(data: Annotated[bytes, Body(media_type="application/octet-stream")]):
+    return jsonify({"size": len(data)})
+
+
+@app.post("/items")
+@parameter_validator
+def post_items(items: Annotated[List[Item], Body(media_type="text/csv")]):
+    return jsonify([item.model_dump() for item in items])
+
+
+@app.post("/item")
+@parameter_validator
+def post_item(item: Item):
+    return jsonify(item.model_dump())
+
+
+@app.post("/form")
+@parameter_validator
+def post_form(
+    name: Annotated[str, Form()] = "anonymous", age: Annotated[int, Form()] = 0
+):
+    return jsonify({"name": name, "age": age})
+
+
+@pytest.mark.parametrize(
+    "data,content_type",
+    [
+        ('{"name": "Foo"}', "application/json"),
+        ("name=Foo", "text/plain"),
+        (b"\x00", "application/octet-stream"),
+    ],
+)
+def test_form_defaults_on_undeclared_content_type(data, content_type):
+    response = client.post("/form", data=data, content_type=content_type)
+    assert response.status_code == 200, response.text
+    assert response.get_json() == {"name": "anonymous", "age": 0}
+
+
+def test_text():
+    response = client.post(
+        "/text",
+        data="héllo".encode("latin-1"),
+        content_type="text/plain; charset=latin-1",
+    )
+    assert response.status_code == 200, response.text
+    assert response.get_json() == {"text": "héllo"}
+
+
+def test_text_without_content_type():
+    response = client.post("/text", data=b"hello")
+    assert response.status_code == 200, response.text
+    assert response.get_json() == {"text": "hello"}
+
+
+def test_text_decode_error():
+    response = client.post("/text", data=b"\xff", content_type="text/plain")
+    assert response.status_code == 422
+    (error,) = response.get_json()["detail"]
+    assert error["type"] == "body_decode"
+    assert error["loc"] == ["body"]
+    assert error["msg"] == "Body could not be decoded as text/plain"
+
+
+def test_text_unknown_charset():
+    response = client.post(
+        "/text", data=b"hello", content_type="text/plain; charset=bogus"
+    )
+    assert response.status_code == 422
+    (error,) = response.get_json()["detail"]
+    assert error["type"] == "body_decode"
+    assert error["loc"] == ["body"]
+    assert error["ctx"] == {"error": "unknown encoding: bogus"}
+
+
+def test_bytes():
+    response = client.post(
+        "/bytes", data=b"\x00\x01\x02", content_type="application/octet-stream"
+    )
+    assert response.status_code == 200, response.text
+    assert response.get_json() == {"size": 3}
+
+
+def test_empty_bytes_is_missing():
+    response = client.post("/bytes", content_type="application/octet-stream")
+    assert response.status_code == 422
+    assert response.get_json()["detail"][0]["type"] == "missing"
+
+
+def test_registered_parser():
+    response = client.post(
+        "/items", data="name,price\nFoo,1.5\nBar,2\n", content_type="text/csv"
+    )
+    assert response.status_code == 200, response.text
+    assert response.get_json() == [
+        {"name": "Foo", "price": 1.5},
+        {"name": "Bar", "price": 2.0},
+    ]
+
+
+def test_registered_parser_errors_keep_body_loc():
+    response = client.post(
+        "/items", data="name,price\nFoo,x\n", content_type="text/csv"
+    )
+    assert response.status_code == 422
+    assert response.get_json()["detail"][0]["loc"] == ["body", 0, "price"]
+
+
+def test_structured_json_suffix():
+    response = client.post(
+        "/item",
+        data='{"name": "Foo", "price": 1}',
+        content_type="application/vnd.api+json",
+    )
+    assert response.status_code == 200, response.text
+    assert response.get_json() == {"name": "Foo", "price": 1.0}
+
+
+def test_undeclared_content_type_is_not_parsed():
+    response = client.post(
+        "/item", data='{"name": "Foo", "price": 1}', content_type="text/csv"
+    )
+    assert response.status_code == 422
+    assert response.get_json()["detail"][0]["type"] == "model_attributes_type"
+
+
+def test_route_table():
+    dependant = post_items.dependant
+    assert dependant.body_parsers == {"text/csv": parse_csv, "": parse_csv}
+    assert dependant.get_body_parser("application/json") is parse_bytes
+    assert post_item.dependant.get_body_parser("application/json") is parse_json
+
+
+@pytest.mark.parametrize(
+    "media_type,parser",
+    [
+        ("application/json", parse_json),
+        ("application/problem+json", parse_json),
+        ("TEXT/Markdown", parse_text),
+        ("image/png", parse_bytes),
+    ],
+)
+def test_resolve_body_parser(media_type, parser):
+    assert resolve_body_parser(media_type) is parser
+
+
+def test_register_body_parser_lowercases():
+    register_body_parser("Application/X-Test", parse_text)
+    try:
+        assert resolve_body_parser("application/x-test") is parse_text
+    finally:
+        del body_parsers["application/x-test"]
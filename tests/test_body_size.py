@@ -0,0 +1,83 @@
+import io
+from typing import Annotated
+
+import pytest
+from flask import Flask, jsonify
+from pydantic import BaseModel
+from werkzeug.datastructures import FileStorage
+
+from flask_request_data_validator import Body, File, Form, parameter_validator
+
+app = Flask(__name__)
+client = app.test_client()
+
+
+class Item(BaseModel):
+    name: str
+
+
+@app.post("/body")
+@parameter_validator
+def create_item(item: Annotated[Item, Body(max_bytes=32)]):
+    return jsonify(item.model_dump())
+
+
+@app.post("/route")
+@parameter_validator(max_bytes=32)
+def create_item_route_limit(item: Item):
+    return jsonify(item.model_dump())
+
+
+@app.post("/form")
+@parameter_validator
+def create_form(name: Annotated[str, Form(max_bytes=32)]):
+    return jsonify({"name": name})
+
+
+@app.post("/file")
+@parameter_validator(max_bytes=1024)
+def upload(file: Annotated[FileStorage, File(max_bytes=512)]):
+    return jsonify({"file": file.read().decode()})
+
+
+@pytest.mark.parametrize("path", ["/body", "/route"])
+def test_body_within_limit(path):
+    response = client.post(path, json={"name": "Foo"})
+    assert response.status_code == 200, response.text
+    assert response.get_json() == {"name": "Foo"}
+
+
+@pytest.mark.parametrize("path", ["/body", "/route"])
+def test_body_content_length_over_limit(path):
+    response = client.post(path, json={"name": "F" * 64})
+    assert response.status_code == 413
+    assert response.get_json() == {"detail": "Request Entity Too Large"}
+
+
+@pytest.mark.parametrize(
+    "data,expected_status",
+    [(b'{"name": "Foo"}', 200), (b'{"name": "' + b"F" * 64 + b'"}', 413)],
+)
+def test_chunked_body(data, expected_status):
+    stream = io.BytesIO(data)
+    response = client.post(
+        "/body",
+        input_stream=stream,
+        headers={"Transfer-Encoding": "chunked", "Content-Type": "application/json"},
+        environ_overrides={"wsgi.input_terminated": True},
+    )
+    assert response.status_code == expected_status
+    if expected_status == 413:
+        assert stream.tell() <= 32 + io.DEFAULT_BUFFER_SIZE
+
+
+def test_form_over_limit():
+    response = client.post("/form", data={"name": "F" * 64})
+    assert response.status_code == 413
+
+
+def test_file_limit_is_most_restrictive():
+    response = client.post("/file", data={"file": (io.BytesIO(b"foo"), "file")})
+    assert response.status_code == 200, response.text
+    response = client.post("/file", data={"file": (io.BytesIO(b"f" * 600), "file")})
+    assert response.status_code == 413
@@ -0,0 +1,217 @@
+import json
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Annotated, List
+
+import pytest
+from flask import Flask, jsonify
+from pydantic import BaseModel
+
+from flask_request_data_validator import Body, parameter_validator, set_bulk_executor
+from flask_request_data_validator.bulk import bulk_annotations, split_json_array
+from flask_request_data_validator import concurrency
+from flask_request_data_validator.concurrency import (
+    DEFAULT_BULK_WORKERS,
+    get_bulk_executor,
+)
+from tests.conftest import match_pydantic_error_url
+
+app = Flask(__name__)
+client = app.test_client()
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+@app.post("/items")
+@parameter_validator
+def create_items(
+    items: Annotated[List[Item], Body(bulk_chunk_size=2, bulk_min_bytes=0)],
+):
+    return jsonify({"count": len(items), "last": items[-1].model_dump()})
+
+
+@app.post("/items/default")
+@parameter_validator
+def create_items_default(items: Annotated[List[Item], Body(bulk_chunk_size=2)]):
+    return jsonify({"count": len(items)})
+
+
+class FailingExecutor(Executor):
+    def submit(self, fn, /, *args, **kwargs):
+        raise AssertionError("small bodies must not use the pool")
+
+
+@pytest.fixture(scope="module")
+def executor():
+    executor = ProcessPoolExecutor(max_workers=2)
+    set_bulk_executor(executor)
+    yield executor
+    set_bulk_executor(None)
+    executor.shutdown()
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (b"[1, 2, 3, 4, 5]", [b"[1, 2]", b"[3, 4]", b"[5]"]),
+        (b' [{"a": [1, 2]}, "x,]}", 3] ', [b'[{"a": [1, 2]}, "x,]}"]', b"[3]"]),
+        (b'[{"a": "\\"]"}, {"a": "\\\\"}, 3]', [b'[{"a": "\\"]"}, {"a": "\\\\"}]', b"[3]"]),
+        (b"[[1, [2, 3]], {}, [4]]", [b"[[1, [2, 3]], {}]", b"[[4]]"]),
+        (b"[1, 2]", [b"[1, 2]"]),
+        (b"[ ]", [b"[ ]"]),
+        (b"[1 2]", [b"[1 2]"]),
+        (b'{"a": 1}', None),
+        (b"[1, 2", None),
+        (b"[1, 2,]", None),
+        (b"[1] 2", None),
+    ],
+)
+def test_split_json_array(data, expected):
+    assert split_json_array(data, 2) == expected
+
+
+@pytest.mark.parametrize("text", ["a]b", "a[b", "{", "}}", '"[', "\\["])
+def test_split_json_array_ignores_brackets_in_strings(text):
+    items = [{"name": text, "tags": [text, {"a": text}], "n": i} for i in range(50)]
+    chunks = split_json_array(json.dumps(items).encode(), 10)
+    assert [item for chunk in chunks for item in json.loads(chunk)] == items
+    assert len(chunks) >= 4
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 100, 1000])
+def test_split_json_array_keeps_every_item(chunk_size):
+    items = [
+        {"name": f"item-{i}", "tags": ["a", "[b"] * (i % 3), "owners": [{"a": "}"}]}
+        for i in range(2000)
+    ]
+    chunks = split_json_array(json.dumps(items).encode(), chunk_size)
+    assert [item for chunk in chunks for item in json.loads(chunk)] == items
+    assert len(chunks) >= len(items) // chunk_size // 2
+
+
+def test_bulk_body(executor):
+    items = [{"name": f"item-{i}", "price": i} for i in range(7)]
+    response = client.post("/items", json=items)
+    assert response.status_code == 200, response.text
+    assert response.get_json() == {
+        "count": 7,
+        "last": {"name": "item-6", "price": 6.0},
+    }
+
+
+def test_bulk_errors_are_shifted(executor):
+    items = [{"name": f"item-{i}", "price": i} for i in range(7)]
+    items[1]["price"] = "x"
+    del items[5]["name"]
+    response = client.post("/items", json=items)
+    assert response.status_code == 422
+    assert response.get_json() == {
+        "detail": [
+            {
+                "type": "float_parsing",
+                "loc": ["body", 1, "price"],
+                "msg": "Input should be a valid number, unable to parse string as a number",
+                "input": "x",
+                "url": match_pydantic_error_url("float_parsing"),
+            },
+            {
+                "type": "missing",
+                "loc": ["body", 5, "name"],
+                "msg": "Field required",
+                "input": {"price": 5},
+                "url": match_pydantic_error_url("missing"),
+            },
+        ]
+    }
+
+
+def test_bulk_invalid_json_falls_back(executor):
+    data = b'[{"name": "a", "price": 1}, {"name": "b", "price": 2}, 3,]'
+    response = client.post("/items", data=data, content_type="application/json")
+    assert response.status_code == 422
+    assert response.get_json()["detail"][0]["type"] == "json_invalid"
+
+
+def test_bulk_non_object_item_keeps_python_error(executor):
+    items = [{"name": "a", "price": 1}, {"name": "b", "price": 2}, 3]
+    response = client.post("/items", json=items)
+    assert response.status_code == 422
+    assert response.get_json() == {
+        "detail": [
+            {
+                "type": "model_attributes_type",
+                "loc": ["body", 2],
+                "msg": "Input should be a valid dictionary or object to extract fields from",
+                "input": 3,
+                "url": match_pydantic_error_url("model_attributes_type"),
+            }
+        ]
+    }
+
+
+def test_small_bulk_body_is_validated_inline():
+    set_bulk_executor(None)
+    response = client.post("/items", json=[{"name": "a", "price": 1}])
+    assert response.status_code == 200
+    assert response.get_json()["count"] == 1
+
+
+def test_body_below_min_bytes_is_validated_inline():
+    set_bulk_executor(FailingExecutor())
+    try:
+        items = [{"name": f"item-{i}", "price": i} for i in range(7)]
+        response = client.post("/items/default", json=items)
+    finally:
+        set_bulk_executor(None)
+    assert response.status_code == 200, response.text
+    assert response.get_json() == {"count": 7}
+
+
+def test_small_body_does_not_create_the_pool():
+    set_bulk_executor(None)
+    response = client.post("/items", json=[{"name": "a", "price": 1}])
+    assert response.status_code == 200
+    assert concurrency._bulk_executor is None
+
+
+def test_default_bulk_executor_is_capped():
+    set_bulk_executor(None)
+    executor = get_bulk_executor()
+    try:
+        assert executor._max_workers == min(DEFAULT_BULK_WORKERS, os.cpu_count() or 1)
+    finally:
+        set_bulk_executor(None)
+        executor.shutdown()
+
+
+def test_bulk_annotation_is_registered():
+    assert List[Item] in bulk_annotations
+
+
+@pytest.mark.parametrize(
+    "annotation",
+    [
+        Annotated[Item, Body(bulk_chunk_size=2)],
+        Annotated[List[Item], Body(bulk_chunk_size=2, max_length=3)],
+    ],
+)
+def test_bulk_requires_unconstrained_list(annotation):
+    def view(items: annotation):
+        return "ok"
+
+    with pytest.raises(ValueError):
+        parameter_validator(view)
+
+
+def test_bulk_requires_single_body():
+    def view(
+        items: Annotated[List[Item], Body(bulk_chunk_size=2)],
+        note: Annotated[str, Body()],
+    ):
+        return "ok"
+
+    with pytest.raises(ValueError):
+        parameter_validator(view)
@@ -0,0 +1,124 @@
+import io
+from typing import Annotated, List, Optional
+
+import pytest
+from flask import Flask, jsonify
+from pydantic import BaseModel
+from werkzeug.datastructures import FileStorage
+
+from flask_request_data_validator import (
+    Body,
+    Cookie,
+    File,
+    Form,
+    Header,
+    Path,
+    Query,
+    parameter_validator,
+)
+
+app = Flask(__name__)
+client = app.test_client()
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+    tags: List[str] = []
+
+
+class Owner(BaseModel):
+    name: str
+    item: Optional[Item] = None
+
+
+def read_items(
+    item_id: Annotated[int, Path()],
+    x_token: Annotated[str, Header(max_length=5)],
+    q: Annotated[List[int], Query()],
+    session: Annotated[Optional[str], Cookie()] = None,
+    limit: Annotated[int, Query(ge=1)] = 10,
+    item: Annotated[Item, Body()] = None,
+    owner: Annotated[Optional[Owner], Body()] = None,
+):
+    return jsonify(
+        {
+            "item_id": item_id,
+            "x_token": x_token,
+            "q": q,
+            "session": session,
+            "limit": limit,
+            "item": item.model_dump() if item else None,
+            "owner": owner.model_dump() if owner else None,
+        }
+    )
+
+
+app.put("/items/<item_id>", endpoint="per_field")(parameter_validator(read_items))
+app.put("/combined/items/<item_id>", endpoint="combined")(
+    parameter_validator(combined_validation=True)(read_items)
+)
+
+
+def upload(
+    file: Annotated[FileStorage, File()],
+    note: Annotated[str, Form(max_length=3)],
+):
+    return jsonify({"file": file.read().decode(), "note": note})
+
+
+app.post("/upload", endpoint="upload")(parameter_validator(upload))
+app.post("/combined/upload", endpoint="combined_upload")(
+    parameter_validator(combined_validation=True)(upload)
+)
+
+
+@pytest.mark.parametrize(
+    "path,headers,json",
+    [
+        (
+            "/items/1?q=1&q=2",
+            {"x-token": "abc"},
+            {"item": {"name": "Foo", "price": 1.5}},
+        ),
+        (
+            "/items/1?q=1&limit=0",
+            {"x-token": "abcdef"},
+            {"item": {"name": "Foo", "price": "x"}, "owner": {"item": {}}},
+        ),
+        ("/items/foo", {}, {"owner": {"name": "Bar"}}),
+        ("/items/foo?q=a&q=b", {"x-token": "a"}, None),
+        ("/items/1?q=1", {"x-token": "a"}, [1, 2]),
+    ],
+)
+def test_combined_validation_matches_per_field(path, headers, json):
+    expected = client.put(path, headers=headers, json=json)
+    response = client.put(f"/combined{path}", headers=headers, json=json)
+    assert response.status_code == expected.status_code
+    assert response.get_json() == expected.get_json()
+
+
+def test_combined_validation_broken_json():
+    kwargs = {
+        "headers": {"content-type": "application/json", "x-token": "abcdef"},
+        "data": "{some broken json}",
+    }
+    expected = client.put("/items/1", **kwargs)
+    response = client.put("/combined/items/1", **kwargs)
+    assert response.status_code == 422
+    assert response.get_json() == expected.get_json()
+
+
+@pytest.mark.parametrize(
+    "make_data",
+    [
+        lambda: {"file": (io.BytesIO(b"foo"), "file"), "note": "abc"},
+        lambda: {"note": "abcd"},
+        lambda: {},
+    ],
+)
+def test_combined_validation_form(make_data):
+    expected = client.post("/upload", data=make_data())
+    response = client.post("/combined/upload", data=make_data())
+    assert response.status_code == expected.status_code
+    assert response.get_json() == expected.get_json()
@@ -0,0 +1,83 @@
+import datetime
+from typing import Annotated, List
+
+import pytest
+from flask import Flask
+from pydantic import BaseModel
+
+from flask_request_data_validator import (
+    Query,
+    json_response,
+    parameter_validator,
+    set_json_encoder,
+)
+from flask_request_data_validator.encoders import get_json_encoder, json_encoders
+from tests.conftest import match_pydantic_error_url
+
+app = Flask(__name__)
+client = app.test_client()
+
+
+class Item(BaseModel):
+    name: str
+    tags: List[str]
+    created: datetime.date
+
+
+@app.get("/items")
+@parameter_validator
+def read_items(limit: Annotated[int, Query(le=10)]):
+    return json_response(
+        [Item(name="Foo", tags=["a"], created=datetime.date(2024, 1, 2))] * limit,
+        headers={"X-Count": str(limit)},
+    )
+
+
+@pytest.fixture(params=sorted(json_encoders))
+def encoder(request):
+    set_json_encoder(request.param)
+    yield request.param
+    set_json_encoder("json")
+
+
+def test_json_response(encoder):
+    response = client.get("/items?limit=2")
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    assert response.headers["X-Count"] == "2"
+    assert (
+        response.get_json()
+        == [{"name": "Foo", "tags": ["a"], "created": "2024-01-02"}] * 2
+    )
+
+
+def test_error_response(encoder):
+    response = client.get("/items?limit=11")
+    assert response.status_code == 422
+    assert response.get_json() == {
+        "detail": [
+            {
+                "type": "less_than_equal",
+                "loc": ["query", "limit"],
+                "msg": "Input should be less than or equal to 10",
+                "input": "11",
+                "ctx": {"le": 10},
+                "url": match_pydantic_error_url("less_than_equal"),
+            }
+        ]
+    }
+
+
+def test_custom_encoder():
+    set_json_encoder(lambda obj: b'"custom"')
+    try:
+        response = client.get("/items?limit=1")
+        assert response.get_data() == b'"custom"'
+    finally:
+        set_json_encoder("json")
+
+
+def test_unknown_encoder():
+    with pytest.raises(ValueError):
+        set_json_encoder("unknown")
+    assert get_json_encoder() is json_encoders["json"]
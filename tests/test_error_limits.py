@@ -0,0 +1,100 @@
+from typing import Annotated, Dict, List
+
+import pytest
+from flask import Flask, jsonify
+from pydantic import BaseModel
+
+from flask_request_data_validator import Query, parameter_validator
+from flask_request_data_validator.exception_handlers import limit_errors
+
+app = Flask(__name__)
+client = app.test_client()
+
+
+class Item(BaseModel):
+    name: str
+    tags: List[str]
+    meta: Dict[str, Dict[str, int]]
+
+
+@app.post("/items")
+@parameter_validator
+def create_item(item: Item):
+    return jsonify(item.model_dump())
+
+
+@app.get("/items")
+@parameter_validator
+def read_items(a: Annotated[int, Query()], b: Annotated[int, Query()]):
+    return jsonify({"a": a, "b": b})
+
+
+@pytest.fixture
+def config():
+    yield app.config
+    for key in list(app.config):
+        if key.startswith("VALIDATION_ERROR_"):
+            del app.config[key]
+
+
+def test_defaults_echo_full_input():
+    body = {"name": 1, "tags": "x" * 1000, "meta": {}}
+    response = client.post("/items", json=body)
+    assert response.status_code == 422
+    assert response.get_json()["detail"][1]["input"] == "x" * 1000
+
+
+def test_max_errors(config):
+    config["VALIDATION_ERROR_MAX_ERRORS"] = 1
+    response = client.get("/items?a=x&b=y")
+    assert response.status_code == 422
+    assert [error["loc"] for error in response.get_json()["detail"]] == [["query", "a"]]
+
+
+def test_omit_input(config):
+    config["VALIDATION_ERROR_OMIT_INPUT"] = True
+    response = client.get("/items?a=x")
+    detail = response.get_json()["detail"]
+    assert len(detail) == 2
+    assert all("input" not in error for error in detail)
+    assert detail[0]["type"] == "int_parsing"
+
+
+def test_max_input_bytes_keeps_small_inputs(config):
+    config["VALIDATION_ERROR_MAX_INPUT_BYTES"] = 10
+    response = client.post("/items", json={"name": "n" * 1000, "tags": [], "meta": 1})
+    assert response.status_code == 422
+    detail = response.get_json()["detail"]
+    assert detail[0]["loc"] == ["body", "meta"]
+    assert detail[0]["input"] == 1
+
+
+def test_max_input_bytes_on_model_input(config):
+    config["VALIDATION_ERROR_MAX_INPUT_BYTES"] = 10
+    response = client.post("/items", data="z" * 1000, content_type="text/plain")
+    assert response.status_code == 422
+    assert response.get_json()["detail"][0]["input"] == "z" * 10 + "..."
+
+
+def test_limit_errors_truncates_strings():
+    errors = [{"type": "x", "input": "é" * 10}]
+    (error,) = limit_errors(errors, max_input_bytes=5)
+    assert error["input"] == "éé..."
+    assert errors[0]["input"] == "é" * 10
+
+
+def test_limit_errors_truncates_containers():
+    errors = [{"type": "x", "input": {"a": ["1" * 4, "2" * 4, "3" * 4], "b": 1}}]
+    (error,) = limit_errors(errors, max_input_bytes=8)
+    assert error["input"] == {"a": ["1111", "222...", "..."], "...": "..."}
+
+
+def test_limit_errors_depth():
+    errors = [{"type": "x", "input": {"a": {"b": {"c": 1}}, "d": [1, [2]]}}]
+    (error,) = limit_errors(errors, max_input_depth=2)
+    assert error["input"] == {"a": {"b": "..."}, "d": [1, "..."]}
+
+
+def test_limit_errors_without_input():
+    errors = [{"type": "x"}]
+    assert limit_errors(errors, max_input_bytes=1, max_input_depth=0) == errors
@@ -0,0 +1,106 @@
+from typing import Annotated
+
+import pytest
+from flask import Flask, jsonify
+from pydantic import BaseModel
+
+from flask_request_data_validator import Body, Header, Path, Query, parameter_validator
+from flask_request_data_validator import validator as validator_module
+from tests.conftest import match_pydantic_error_url
+
+app = Flask(__name__)
+client = app.test_client()
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+@app.post("/items/<item_id>")
+@parameter_validator(fail_fast=True)
+def create_item(
+    item_id: Annotated[int, Path()],
+    q: Annotated[int, Query()],
+    x_token: Annotated[str, Header()],
+    item: Annotated[Item, Body()],
+    count: Annotated[int, Body()],
+):
+    return jsonify(
+        {"item_id": item_id, "q": q, "x_token": x_token, "item": item.model_dump()}
+    )
+
+
+@pytest.fixture
+def no_body_read(monkeypatch):
+    def read_body(self):
+        raise AssertionError("body should not be read")
+
+    monkeypatch.setattr(validator_module.ParameterValidator, "_read_body", read_body)
+
+
+def test_valid():
+    response = client.post(
+        "/items/1?q=2",
+        json={"item": {"name": "Foo", "price": 1}, "count": 3},
+        headers={"x-token": "Bar"},
+    )
+    assert response.status_code == 200, response.text
+    assert response.get_json() == {
+        "item_id": 1,
+        "q": 2,
+        "x_token": "Bar",
+        "item": {"name": "Foo", "price": 1.0},
+    }
+
+
+def test_path_is_checked_first(no_body_read):
+    response = client.post("/items/foo", json={})
+    assert response.status_code == 422
+    assert response.get_json() == {
+        "detail": [
+            {
+                "type": "int_parsing",
+                "loc": ["path", "item_id"],
+                "msg": "Input should be a valid integer, unable to parse string as an integer",
+                "input": "foo",
+                "url": match_pydantic_error_url("int_parsing"),
+            }
+        ]
+    }
+
+
+def test_stops_at_first_missing_param(no_body_read):
+    response = client.post("/items/1", json={})
+    assert response.status_code == 422
+    assert response.get_json() == {
+        "detail": [
+            {
+                "type": "missing",
+                "loc": ["header", "x-token"],
+                "msg": "Field required",
+                "input": None,
+                "url": match_pydantic_error_url("missing"),
+            }
+        ]
+    }
+
+
+def test_stops_at_first_body_field():
+    response = client.post(
+        "/items/1?q=2",
+        json={"item": {"name": "Foo", "price": "x"}, "count": "y"},
+        headers={"x-token": "Bar"},
+    )
+    assert response.status_code == 422
+    assert [error["loc"] for error in response.get_json()["detail"]] == [
+        ["body", "item", "price"]
+    ]
+
+
+def test_rejects_combined_validation():
+    def view(q: Annotated[int, Query()]):
+        return "ok"
+
+    with pytest.raises(ValueError):
+        parameter_validator(fail_fast=True, combined_validation=True)(view)
@@ -0,0 +1,27 @@
+from flask_request_data_validator import Query
+from flask_request_data_validator.dependant import FieldPlan
+from tests.conftest import match_pydantic_error_url
+
+
+def make_plan():
+    return FieldPlan("q", Query(), key="q", loc=("query", "q"), getlist=False)
+
+
+def test_missing_error():
+    assert make_plan().missing_error() == {
+        "type": "missing",
+        "loc": ("query", "q"),
+        "msg": "Field required",
+        "input": None,
+        "url": match_pydantic_error_url("missing"),
+    }
+
+
+def test_missing_errors_are_not_shared():
+    plan = make_plan()
+    error = plan.missing_error()
+    error["loc"] = ("body",) + error["loc"]
+    error["msg"] = "mutated"
+    error["ctx"] = {"mutated": True}
+    assert plan.missing_error() == make_plan().missing_error()
+    assert plan.missing_error() is not plan.missing_error()
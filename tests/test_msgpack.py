@@ -0,0 +1,151 @@
+from datetime import datetime
+from typing import Annotated, List
+
+import pytest
+from flask import Flask, jsonify
+from pydantic import BaseModel
+
+from flask_request_data_validator import Body, Form, Query, parameter_validator
+from flask_request_data_validator.body_parsers import parse_bytes, parse_msgpack
+from tests.conftest import match_pydantic_error_url
+
+msgpack = pytest.importorskip("msgpack")
+
+app = Flask(__name__)
+client = app.test_client()
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+    tags: List[str] = []
+
+
+class Stamped(BaseModel):
+    name: str
+    created: datetime
+
+
+@app.post("/items")
+@parameter_validator(msgpack=True)
+def create_item(item: Item, q: Annotated[int, Query()] = 0):
+    return jsonify({"item": item.model_dump(), "q": q})
+
+
+@app.post("/embedded")
+@parameter_validator(msgpack=True)
+def create_embedded(item: Item, count: Annotated[int, Body(ge=1)]):
+    return jsonify({"item": item.model_dump(), "count": count})
+
+
+@app.post("/form")
+@parameter_validator(msgpack=True)
+def post_form(name: Annotated[str, Form()]):
+    return jsonify({"name": name})
+
+
+@app.get("/stamped")
+@parameter_validator(response_model=Stamped, msgpack=True)
+def get_stamped():
+    return {"name": "Foo", "created": datetime(2024, 1, 2, 3, 4, 5)}
+
+
+@app.post("/json-only")
+@parameter_validator(response_model=Item)
+def create_json_only(item: Item):
+    return item
+
+
+def post_msgpack(path, obj, content_type="application/msgpack"):
+    return client.post(path, data=msgpack.packb(obj), content_type=content_type)
+
+
+@pytest.mark.parametrize(
+    "content_type", ["application/msgpack", "application/x-msgpack"]
+)
+def test_body(content_type):
+    response = post_msgpack(
+        "/items?q=1", {"name": "Foo", "price": 1, "tags": ["a"]}, content_type
+    )
+    assert response.status_code == 200, response.text
+    assert response.get_json() == {
+        "item": {"name": "Foo", "price": 1.0, "tags": ["a"]},
+        "q": 1,
+    }
+
+
+def test_embedded_body_errors():
+    response = post_msgpack("/embedded", {"item": {"name": "Foo"}, "count": 0})
+    assert response.status_code == 422
+    assert response.get_json() == {
+        "detail": [
+            {
+                "type": "missing",
+                "loc": ["body", "item", "price"],
+                "msg": "Field required",
+                "input": {"name": "Foo"},
+                "url": match_pydantic_error_url("missing"),
+            },
+            {
+                "type": "greater_than_equal",
+                "loc": ["body", "count"],
+                "msg": "Input should be greater than or equal to 1",
+                "input": 0,
+                "ctx": {"ge": 1},
+                "url": match_pydantic_error_url("greater_than_equal"),
+            },
+        ]
+    }
+
+
+def test_invalid_msgpack():
+    response = client.post(
+        "/items", data=b"\x92\x01", content_type="application/msgpack"
+    )
+    assert response.status_code == 422
+    (error,) = response.get_json()["detail"]
+    assert error["type"] == "body_decode"
+    assert error["loc"] == ["body"]
+
+
+def test_not_accepted_on_form_routes():
+    response = post_msgpack("/form", {"name": "Foo"})
+    assert response.status_code == 422
+    assert response.get_json()["detail"][0]["type"] == "missing"
+
+
+def test_response_negotiation():
+    response = client.get("/stamped", headers={"accept": "application/msgpack"})
+    assert response.status_code == 200
+    assert response.mimetype == "application/msgpack"
+    assert response.headers["vary"] == "Accept"
+    assert msgpack.unpackb(response.data) == {
+        "name": "Foo",
+        "created": "2024-01-02T03:04:05",
+    }
+
+
+@pytest.mark.parametrize("accept", [None, "*/*", "application/json"])
+def test_response_defaults_to_json(accept):
+    headers = {"accept": accept} if accept else {}
+    response = client.get("/stamped", headers=headers)
+    assert response.mimetype == "application/json"
+    assert response.headers["vary"] == "Accept"
+    assert response.get_json() == {"name": "Foo", "created": "2024-01-02T03:04:05"}
+
+
+def test_not_accepted_without_opt_in():
+    for media_type in ("application/msgpack", "application/x-msgpack"):
+        assert create_json_only.dependant.get_body_parser(media_type) is parse_bytes
+        assert create_item.dependant.get_body_parser(media_type) is parse_msgpack
+
+
+def test_no_negotiation_without_opt_in():
+    response = client.post(
+        "/json-only",
+        json={"name": "Foo", "price": 1},
+        headers={"accept": "application/msgpack"},
+    )
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    assert "vary" not in response.headers
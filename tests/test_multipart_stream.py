@@ -0,0 +1,219 @@
+import io
+from typing import Annotated, List
+
+import pytest
+from flask import Flask, jsonify, request
+from werkzeug.datastructures import FileStorage
+from werkzeug.test import create_environ
+from werkzeug.wrappers import Response
+
+from flask_request_data_validator import File, Form, Path, parameter_validator
+from flask_request_data_validator.multipart import (
+    StreamingFormDataParser,
+    UploadSpool,
+    content_type_allowed,
+)
+
+app = Flask(__name__)
+client = app.test_client()
+
+
+@app.post("/avatar")
+@parameter_validator(spool_threshold=16)
+def upload_avatar(
+    avatar: Annotated[
+        FileStorage, File(max_bytes=64, content_types=["image/png", "image/jpeg"])
+    ],
+    name: Annotated[str, Form()],
+):
+    return jsonify(
+        {
+            "name": name,
+            "size": len(avatar.read()),
+            "spool": type(avatar.stream).__name__,
+            "rolled": avatar.stream._rolled,
+        }
+    )
+
+
+@app.post("/images")
+@parameter_validator
+def upload_images(
+    images: Annotated[List[FileStorage], File(content_types=["image/*"])],
+):
+    return jsonify([image.filename for image in images])
+
+
+@app.post("/docs")
+@parameter_validator(max_bytes=1024 * 1024)
+def upload_doc(
+    doc: Annotated[FileStorage, File()], other: Annotated[FileStorage, File()]
+):
+    return jsonify({"doc": doc.read().decode(), "other": other.read().decode()})
+
+
+@app.post("/albums/<album_id>/photos")
+@parameter_validator(fail_fast=True)
+def upload_photo(
+    album_id: Annotated[int, Path(ge=10)], photo: Annotated[FileStorage, File()]
+):
+    return jsonify({"album_id": album_id, "size": len(photo.read())})
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    calls = []
+    parse = StreamingFormDataParser.parse
+
+    def record_parse(self, *args, **kwargs):
+        calls.append(request.environ["PATH_INFO"])
+        return parse(self, *args, **kwargs)
+
+    monkeypatch.setattr(StreamingFormDataParser, "parse", record_parse)
+    return calls
+
+
+def avatar(data: bytes, content_type: str = "image/png"):
+    return FileStorage(io.BytesIO(data), "a.png", content_type=content_type)
+
+
+def test_small_file_stays_in_memory():
+    response = client.post("/avatar", data={"avatar": avatar(b"x" * 10), "name": "a"})
+    assert response.status_code == 200, response.text
+    assert response.get_json() == {
+        "name": "a",
+        "size": 10,
+        "spool": "UploadSpool",
+        "rolled": False,
+    }
+
+
+def test_large_file_spools_to_disk():
+    response = client.post("/avatar", data={"avatar": avatar(b"x" * 40), "name": "a"})
+    assert response.status_code == 200, response.text
+    assert response.get_json()["rolled"] is True
+
+
+def test_file_too_large():
+    response = client.post("/avatar", data={"avatar": avatar(b"x" * 65), "name": "a"})
+    assert response.status_code == 413
+
+
+class UploadStream(io.RawIOBase):
+    def __init__(self, size):
+        head = (
+            b"--bound\r\n"
+            b'Content-Disposition: form-data; name="avatar"; filename="a.png"\r\n'
+            b"Content-Type: image/png\r\n\r\n"
+        )
+        self.chunks = [head] + [b"x" * 1024] * size
+        self.consumed = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if not self.chunks:
+            return 0
+        self.consumed += 1
+        chunk = self.chunks.pop(0)
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+
+def test_file_too_large_stops_reading():
+    stream = UploadStream(1000)
+    environ = create_environ("/avatar", method="POST")
+    environ["CONTENT_TYPE"] = "multipart/form-data; boundary=bound"
+    environ["wsgi.input"] = io.BufferedReader(stream, 1024)
+    environ["wsgi.input_terminated"] = True
+    response = Response.from_app(app, environ)
+    assert response.status_code == 413
+    assert stream.consumed < 100
+
+
+def test_content_type_rejected():
+    response = client.post(
+        "/avatar", data={"avatar": avatar(b"x", "text/plain"), "name": "a"}
+    )
+    assert response.status_code == 422
+    assert response.get_json() == {
+        "detail": [
+            {
+                "type": "file_content_type",
+                "loc": ["body", "avatar"],
+                "msg": "File content type should be one of: image/png, image/jpeg",
+                "input": "text/plain",
+                "ctx": {"expected": "image/png, image/jpeg"},
+            }
+        ]
+    }
+
+
+def test_content_type_and_missing_file_share_loc():
+    rejected = client.post(
+        "/avatar", data={"avatar": avatar(b"x", "text/plain"), "name": "a"}
+    )
+    missing = client.post("/avatar", data={"name": "a"})
+    assert missing.status_code == 422
+    assert (
+        rejected.get_json()["detail"][0]["loc"]
+        == missing.get_json()["detail"][0]["loc"]
+    )
+
+
+def test_content_type_wildcard():
+    response = client.post(
+        "/images",
+        data={"images": [avatar(b"x", "image/gif"), avatar(b"y", "image/webp")]},
+    )
+    assert response.status_code == 200, response.text
+    assert response.get_json() == ["a.png", "a.png"]
+    response = client.post("/images", data={"images": [avatar(b"x", "video/mp4")]})
+    assert response.status_code == 422
+
+
+def test_files_without_limits():
+    response = client.post(
+        "/docs",
+        data={
+            "doc": FileStorage(io.BytesIO(b"doc"), "d.txt"),
+            "other": FileStorage(io.BytesIO(b"other"), "o.txt"),
+        },
+    )
+    assert response.status_code == 200, response.text
+    assert response.get_json() == {"doc": "doc", "other": "other"}
+
+
+def test_content_type_allowed():
+    assert content_type_allowed("image/PNG; q=1", ["image/png"])
+    assert content_type_allowed("image/png", ["image/*"])
+    assert not content_type_allowed("imagex/png", ["image/*"])
+    assert not content_type_allowed(None, ["image/png"])
+
+
+def test_upload_spool_limit():
+    spool = UploadSpool(4, max_bytes=4)
+    spool.write(b"abcd")
+    try:
+        spool.write(b"e")
+    except Exception as exc:
+        assert exc.__class__.__name__ == "RequestEntityTooLarge"
+    else:
+        raise AssertionError
+
+
+def test_fail_fast_rejects_path_before_parsing(parse_calls):
+    response = client.post(
+        "/albums/1/photos", data={"photo": avatar(b"x" * 1024 * 1024)}
+    )
+    assert response.status_code == 422
+    assert response.get_json()["detail"][0]["loc"] == ["path", "album_id"]
+    assert parse_calls == []
+
+
+def test_fail_fast_parses_files_last(parse_calls):
+    response = client.post("/albums/10/photos", data={"photo": avatar(b"x" * 100)})
+    assert response.status_code == 200, response.text
+    assert response.get_json() == {"album_id": 10, "size": 100}
+    assert parse_calls == ["/albums/10/photos"]
@@ -0,0 +1,129 @@
+from typing import Annotated, List
+
+import pytest
+from flask import Flask, jsonify
+from pydantic import BaseModel
+
+from flask_request_data_validator import (
+    Body,
+    PartialResult,
+    Query,
+    parameter_validator,
+)
+from tests.conftest import match_pydantic_error_url
+
+app = Flask(__name__)
+client = app.test_client()
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+@app.post("/items")
+@parameter_validator
+def create_items(items: Annotated[List[Item], Body(partial=True)]):
+    assert isinstance(items, PartialResult)
+    return jsonify(
+        {
+            "items": [item.model_dump() for item in items],
+            "indexes": items.indexes,
+            "errors": items.errors,
+            "ok": items.ok,
+        }
+    )
+
+
+@app.post("/batches")
+@parameter_validator
+def create_batch(
+    q: Annotated[int, Query()],
+    items: Annotated[List[Item], Body(partial=True)],
+    note: Annotated[str, Body()],
+):
+    return jsonify({"count": len(items), "errors": len(items.errors), "note": note})
+
+
+def test_all_valid():
+    response = client.post("/items", json=[{"name": "a", "price": 1}])
+    assert response.status_code == 200
+    assert response.get_json() == {
+        "items": [{"name": "a", "price": 1.0}],
+        "indexes": [0],
+        "errors": [],
+        "ok": True,
+    }
+
+
+def test_partial_success():
+    response = client.post(
+        "/items",
+        json=[{"name": "a", "price": 1}, {"name": "b", "price": "x"}, {"price": 3}],
+    )
+    assert response.status_code == 200
+    assert response.get_json() == {
+        "items": [{"name": "a", "price": 1.0}],
+        "indexes": [0],
+        "errors": [
+            {
+                "type": "float_parsing",
+                "loc": ["body", 1, "price"],
+                "msg": "Input should be a valid number, unable to parse string as a number",
+                "input": "x",
+                "url": match_pydantic_error_url("float_parsing"),
+            },
+            {
+                "type": "missing",
+                "loc": ["body", 2, "name"],
+                "msg": "Field required",
+                "input": {"price": 3},
+                "url": match_pydantic_error_url("missing"),
+            },
+        ],
+        "ok": False,
+    }
+
+
+def test_not_a_list_is_rejected():
+    response = client.post("/items", json={"name": "a", "price": 1})
+    assert response.status_code == 422
+    assert response.get_json()["detail"][0]["loc"] == ["body"]
+    assert response.get_json()["detail"][0]["type"] == "list_type"
+
+
+def test_missing_body_is_rejected():
+    response = client.post("/items")
+    assert response.status_code == 422
+    assert response.get_json()["detail"][0]["type"] == "missing"
+
+
+def test_embedded_partial_body():
+    response = client.post(
+        "/batches?q=1",
+        json={"items": [{"name": "a", "price": 1}, {"name": "b"}], "note": "n"},
+    )
+    assert response.status_code == 200
+    assert response.get_json() == {"count": 1, "errors": 1, "note": "n"}
+
+
+def test_other_params_still_reject():
+    response = client.post("/batches?q=x", json={"items": [{"name": "b"}], "note": "n"})
+    assert response.status_code == 422
+    assert [error["loc"] for error in response.get_json()["detail"]] == [["query", "q"]]
+
+
+def test_partial_requires_list():
+    def view(item: Annotated[Item, Body(partial=True)]):
+        return "ok"
+
+    with pytest.raises(ValueError):
+        parameter_validator(view)
+
+
+def test_partial_rejects_combined_validation():
+    def view(items: Annotated[List[Item], Body(partial=True)]):
+        return "ok"
+
+    with pytest.raises(ValueError):
+        parameter_validator(combined_validation=True)(view)
@@ -0,0 +1,249 @@
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Annotated, List, Optional
+
+import pytest
+from flask import Flask, jsonify
+from pydantic import BaseModel, Field, computed_field, field_serializer
+from typing_extensions import TypedDict
+
+from flask_request_data_validator import Query, parameter_validator
+from flask_request_data_validator.response_model import ResponseModel
+
+app = Flask(__name__)
+client = app.test_client()
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+    item_code: str = Field("a", alias="itemCode")
+    description: Optional[str] = None
+
+
+@app.get("/items")
+@parameter_validator(response_model=List[Item])
+def read_items(limit: Annotated[int, Query()] = 2):
+    return [{"name": f"item-{i}", "price": i, "itemCode": "b"} for i in range(limit)]
+
+
+@app.get("/item")
+@parameter_validator(
+    response_model=Item,
+    response_model_exclude={"description"},
+    response_model_by_alias=False,
+)
+def read_item():
+    return Item(name="Foo", price=1, description="Bar")
+
+
+@app.get("/created")
+@parameter_validator(response_model=Item, response_model_exclude_none=True)
+def create_item():
+    return {"name": "Foo", "price": "1.5"}, 201, {"X-Item": "Foo"}
+
+
+@app.get("/response")
+@parameter_validator(response_model=Item)
+def read_response():
+    return jsonify({"raw": True})
+
+
+@app.get("/invalid")
+@parameter_validator(response_model=Item)
+def read_invalid():
+    return {"name": "Foo"}
+
+
+class Record:
+    def __init__(self, name: str, price: float) -> None:
+        self.name = name
+        self.price = price
+
+
+@app.get("/record")
+@parameter_validator(response_model=Item)
+def read_record():
+    return Record("Foo", 2)
+
+
+def test_list_response():
+    response = client.get("/items?limit=2")
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    assert response.get_json() == [
+        {"name": "item-0", "price": 0.0, "itemCode": "b", "description": None},
+        {"name": "item-1", "price": 1.0, "itemCode": "b", "description": None},
+    ]
+
+
+def test_include_exclude_by_alias():
+    response = client.get("/item")
+    assert response.get_json() == {"name": "Foo", "price": 1.0, "item_code": "a"}
+
+
+def test_tuple_response():
+    response = client.get("/created")
+    assert response.status_code == 201
+    assert response.headers["X-Item"] == "Foo"
+    assert response.get_json() == {"name": "Foo", "price": 1.5, "itemCode": "a"}
+
+
+def test_response_passthrough():
+    response = client.get("/response")
+    assert response.get_json() == {"raw": True}
+
+
+def test_from_attributes():
+    response = client.get("/record")
+    assert response.get_json() == {
+        "name": "Foo",
+        "price": 2.0,
+        "itemCode": "a",
+        "description": None,
+    }
+
+
+def test_invalid_response(caplog):
+    with caplog.at_level(logging.ERROR, logger="flask_request_data_validator"):
+        response = client.get("/invalid")
+    assert response.status_code == 500
+    assert response.get_json() == {"detail": "Internal Server Error"}
+    assert "Response validation failed" in caplog.text
+    assert "'price'" in caplog.text
+
+
+sampled = Flask(__name__)
+sampled_client = sampled.test_client()
+
+
+@sampled.get("/never")
+@parameter_validator(response_model=List[Item], response_validation_rate=0)
+def never_validated():
+    return [Item(name="Foo", price=1), Item(name="Bar", price=2, itemCode="b")]
+
+
+@sampled.get("/never/dict")
+@parameter_validator(response_model=Item, response_validation_rate=0)
+def never_validated_dict():
+    return {"name": "Foo", "price": "2", "secret": "pw"}
+
+
+@sampled.get("/always")
+@parameter_validator(response_model=Item, response_validation_rate=1)
+def always_validated():
+    return {"name": "Foo"}
+
+
+@sampled.get("/app")
+@parameter_validator(response_model=Item)
+def app_rate():
+    return {"name": "Foo"}
+
+
+def test_unsampled_instances_are_not_validated(monkeypatch):
+    response_model = ResponseModel(List[Item], validation_rate=0)
+
+    def validate_python(*args, **kwargs):
+        raise AssertionError("unsampled instances must not be validated")
+
+    monkeypatch.setattr(
+        response_model.type_adapter, "validate_python", validate_python
+    )
+    assert json.loads(
+        response_model.serialize_sampled([Item(name="Foo", price=1)], 0)
+    ) == [{"name": "Foo", "price": 1.0, "itemCode": "a", "description": None}]
+
+
+def test_unsampled_instances(caplog):
+    with caplog.at_level(logging.WARNING, logger="flask_request_data_validator"):
+        response = sampled_client.get("/never")
+    assert response.status_code == 200
+    assert response.get_json() == [
+        {"name": "Foo", "price": 1.0, "itemCode": "a", "description": None},
+        {"name": "Bar", "price": 2.0, "itemCode": "b", "description": None},
+    ]
+    assert caplog.records == []
+
+
+def test_unsampled_dict_is_validated():
+    response = sampled_client.get("/never/dict")
+    assert response.status_code == 200
+    assert response.get_json() == {
+        "name": "Foo",
+        "price": 2.0,
+        "itemCode": "a",
+        "description": None,
+    }
+
+
+class Event(BaseModel):
+    when: datetime
+
+    @field_serializer("when")
+    def serialize_when(self, value: datetime) -> str:
+        return value.strftime("%Y/%m/%d")
+
+
+class Priced(BaseModel):
+    price: float
+
+    @computed_field
+    @property
+    def with_tax(self) -> float:
+        return self.price * 2
+
+
+@dataclass
+class Point:
+    x: int
+
+
+class Movie(TypedDict):
+    title: str
+
+
+@pytest.mark.parametrize(
+    "annotation,value,expected",
+    [
+        (Event, {"when": "2024-01-01T00:00:00"}, {"when": "2024/01/01"}),
+        (List[Priced], [{"price": 1}], [{"price": 1.0, "with_tax": 2.0}]),
+        (Point, {"x": "1", "y": 2}, {"x": 1}),
+        (Movie, {"title": "a", "year": 2000}, {"title": "a"}),
+    ],
+)
+@pytest.mark.parametrize("rate", [0.0, 1.0])
+def test_unsampled_matches_validated(annotation, value, expected, rate):
+    response_model = ResponseModel(annotation)
+    assert json.loads(response_model.serialize_sampled(value, rate)) == expected
+
+
+def test_sampled_mismatch_is_logged(caplog):
+    with caplog.at_level(logging.WARNING, logger="flask_request_data_validator"):
+        response = sampled_client.get("/always")
+    assert response.status_code == 200
+    assert response.get_json() == {"name": "Foo"}
+    assert "Response does not match" in caplog.text
+    assert "'price'" in caplog.text
+
+
+def test_app_wide_rate(caplog):
+    assert sampled_client.get("/app").status_code == 500
+    sampled.config["RESPONSE_VALIDATION_RATE"] = 0.0
+    try:
+        with caplog.at_level(logging.WARNING, logger="flask_request_data_validator"):
+            response = sampled_client.get("/app")
+        assert response.status_code == 200
+        assert response.get_json() == {"name": "Foo"}
+        assert "Response does not match" in caplog.text
+    finally:
+        del sampled.config["RESPONSE_VALIDATION_RATE"]
+
+
+def test_invalid_rate():
+    with pytest.raises(ValueError):
+        parameter_validator(response_model=Item, response_validation_rate=2)(
+            lambda: None
+        )
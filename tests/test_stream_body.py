@@ -0,0 +1,327 @@
+import importlib.util
+import io
+import json
+from typing import Annotated, Iterator, List
+
+import pytest
+from flask import Flask, jsonify
+from pydantic import BaseModel, TypeAdapter
+
+from flask_request_data_validator import (
+    Body,
+    File,
+    RequestValidationError,
+    parameter_validator,
+)
+from flask_request_data_validator.streaming import iter_json_array, iter_ndjson
+from tests.conftest import match_pydantic_error_url
+
+app = Flask(__name__)
+client = app.test_client()
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+@app.post("/items")
+@parameter_validator
+def import_items(items: Annotated[Iterator[Item], Body(stream="ndjson")]):
+    names = [item.name for item in items]
+    return jsonify({"names": names})
+
+
+@app.post("/lazy")
+@parameter_validator
+def lazy_items(items: Annotated[Iterator[Item], Body(stream="ndjson")]):
+    first = next(items)
+    return jsonify({"first": first.name, "type": type(items).__name__})
+
+
+@app.post("/array")
+@parameter_validator
+def import_array(items: Annotated[List[Item], Body(stream="json")]):
+    return jsonify({"names": [item.name for item in items]})
+
+
+@app.post("/limited")
+@parameter_validator(max_bytes=50)
+def limited_items(items: Annotated[Iterator[Item], Body(stream="ndjson")]):
+    return jsonify({"names": [item.name for item in items]})
+
+
+@app.post("/limited/array")
+@parameter_validator(max_bytes=50)
+def limited_array(items: Annotated[List[Item], Body(stream="json")]):
+    return jsonify({"names": [item.name for item in items]})
+
+
+@app.post("/limited/async")
+@parameter_validator(max_bytes=50)
+async def limited_async(items: Annotated[Iterator[Item], Body(stream="ndjson")]):
+    return jsonify({"names": [item.name for item in items]})
+
+
+def ndjson(*records) -> bytes:
+    return b"".join(json.dumps(record).encode() + b"\n" for record in records)
+
+
+def test_stream():
+    data = ndjson({"name": "a", "price": 1}, {"name": "b", "price": 2})
+    response = client.post(
+        "/items", data=data + b"\n", content_type="application/x-ndjson"
+    )
+    assert response.status_code == 200, response.text
+    assert response.get_json() == {"names": ["a", "b"]}
+
+
+def test_stream_is_lazy():
+    data = ndjson({"name": "a", "price": 1}) + b"not json\n"
+    response = client.post("/lazy", data=data, content_type="application/x-ndjson")
+    assert response.status_code == 200
+    assert response.get_json() == {"first": "a", "type": "generator"}
+
+
+def test_chunked_stream():
+    data = ndjson({"name": "a", "price": 1}, {"name": "b", "price": 2})
+    response = client.post(
+        "/items",
+        input_stream=io.BytesIO(data),
+        headers={"Transfer-Encoding": "chunked"},
+        content_type="application/x-ndjson",
+        environ_overrides={"wsgi.input_terminated": True},
+    )
+    assert response.status_code == 200, response.text
+    assert response.get_json() == {"names": ["a", "b"]}
+
+
+@pytest.mark.parametrize(
+    "path,data",
+    [
+        (
+            "/limited",
+            ndjson(*({"name": f"item-{i}", "price": i} for i in range(10))),
+        ),
+        (
+            "/limited/array",
+            json.dumps([{"name": f"item-{i}", "price": i} for i in range(10)]).encode(),
+        ),
+        pytest.param(
+            "/limited/async",
+            ndjson(*({"name": f"item-{i}", "price": i} for i in range(10))),
+            marks=pytest.mark.skipif(
+                importlib.util.find_spec("asgiref") is None,
+                reason="async views need asgiref",
+            ),
+        ),
+    ],
+)
+def test_chunked_stream_over_limit(path, data):
+    response = client.post(
+        path,
+        input_stream=io.BytesIO(data),
+        headers={"Transfer-Encoding": "chunked"},
+        content_type="application/json",
+        environ_overrides={"wsgi.input_terminated": True},
+    )
+    assert response.status_code == 413, response.text
+    assert response.get_json() == {"detail": "Request Entity Too Large"}
+
+
+class UnbufferedStream(io.RawIOBase):
+    def __init__(self, data: bytes) -> None:
+        self._data = io.BytesIO(data)
+        self.reads = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        self.reads += 1
+        return self._data.readinto(buffer)
+
+
+def test_large_chunked_stream():
+    data = ndjson(*({"name": f"item-{i}", "price": i} for i in range(20_000)))
+    response = client.post(
+        "/items",
+        input_stream=io.BytesIO(data),
+        headers={"Transfer-Encoding": "chunked"},
+        content_type="application/x-ndjson",
+        environ_overrides={"wsgi.input_terminated": True},
+    )
+    assert response.status_code == 200, response.text
+    assert len(response.get_json()["names"]) == 20_000
+
+
+def test_ndjson_reads_in_chunks():
+    data = ndjson(*({"name": f"item-{i}", "price": i} for i in range(1000)))
+    stream = UnbufferedStream(data)
+    items = list(
+        iter_ndjson(stream, TypeAdapter(Item), ("body",), chunk_size=4096)
+    )
+    assert [item.name for item in items] == [f"item-{i}" for i in range(1000)]
+    assert stream.reads <= len(data) // 4096 + 2
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64])
+def test_ndjson_lines_across_chunks(chunk_size):
+    data = b'{"name": "a", "price": 1}\n\n{"name": "b", "price": "x"}'
+    items = iter_ndjson(
+        io.BytesIO(data), TypeAdapter(Item), ("body",), chunk_size=chunk_size
+    )
+    assert next(items).name == "a"
+    with pytest.raises(RequestValidationError) as exc_info:
+        next(items)
+    assert exc_info.value.errors[0]["loc"] == ("body", 3, "price")
+
+
+def test_invalid_line():
+    data = ndjson({"name": "a", "price": 1}, {"name": "b"}, {"name": "c", "price": 3})
+    response = client.post("/items", data=data, content_type="application/x-ndjson")
+    assert response.status_code == 422
+    assert response.get_json() == {
+        "detail": [
+            {
+                "type": "missing",
+                "loc": ["body", 2, "price"],
+                "msg": "Field required",
+                "input": {"name": "b"},
+                "url": match_pydantic_error_url("missing"),
+            }
+        ]
+    }
+
+
+def test_invalid_json_line():
+    data = ndjson({"name": "a", "price": 1}) + b"\n{oops\n"
+    response = client.post("/items", data=data, content_type="application/x-ndjson")
+    assert response.status_code == 422
+    error = response.get_json()["detail"][0]
+    assert error["type"] == "json_invalid"
+    assert error["loc"] == ["body", 3]
+
+
+def test_missing_stream():
+    response = client.post("/items")
+    assert response.status_code == 422
+    assert response.get_json()["detail"][0]["type"] == "missing"
+
+
+@pytest.mark.parametrize(
+    "annotation",
+    [
+        Annotated[Item, Body(stream="ndjson")],
+        Annotated[List[Item], Body(stream="ndjson", min_length=1)],
+    ],
+)
+def test_stream_requires_iterable(annotation):
+    def view(items: annotation):
+        return "ok"
+
+    with pytest.raises(ValueError):
+        parameter_validator(view)
+
+
+def test_stream_rejects_other_body_params():
+    def view(
+        items: Annotated[Iterator[Item], Body(stream="ndjson")],
+        upload: Annotated[bytes, File()],
+    ):
+        return "ok"
+
+    with pytest.raises(ValueError):
+        parameter_validator(view)
+
+
+def test_json_array_stream():
+    data = json.dumps([{"name": "a", "price": 1}, {"name": "é", "price": 2.5}])
+    response = client.post("/array", data=data, content_type="application/json")
+    assert response.status_code == 200, response.text
+    assert response.get_json() == {"names": ["a", "é"]}
+
+
+def test_json_array_stream_invalid_utf8():
+    data = b'[{"name": "a", "price": 1}, {"name": "\xff", "price": 2}]'
+    response = client.post("/array", data=data, content_type="application/json")
+    assert response.status_code == 422, response.text
+    (error,) = response.get_json()["detail"]
+    assert error["type"] == "json_invalid"
+    assert error["loc"] == ["body", 38]
+
+
+def test_json_array_stream_invalid_item():
+    data = json.dumps([{"name": "a", "price": 1}, {"name": "b", "price": "x"}])
+    response = client.post("/array", data=data, content_type="application/json")
+    assert response.status_code == 422
+    assert response.get_json()["detail"][0]["loc"] == ["body", 1, "price"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1024])
+def test_iter_json_array_chunks(chunk_size):
+    values = [12345, -1.5e3, 'é,]"', [1, [2]], {"a": {"b": None}}, True, None]
+    data = (" \n" + json.dumps(values, ensure_ascii=False) + " \n").encode()
+    stream = iter_json_array(
+        io.BytesIO(data), TypeAdapter(object), ("body",), chunk_size
+    )
+    assert list(stream) == values
+
+
+@pytest.mark.parametrize(
+    "data,msg,pos",
+    [
+        (b'{"a": 1}', "Expecting '['", 0),
+        (b"[1, 2", "Expecting ',' delimiter", 5),
+        (b"[1, 2,]", "Expecting value", 6),
+        (b"[1 2]", "Expecting ',' delimiter", 3),
+        (b"[1] 2", "Extra data", 4),
+        (b"", "Expecting '['", 0),
+        (b'[1, "\xff\xfe"]', "Invalid UTF-8: invalid start byte", 5),
+        (b"[1, 22\xc3", "Invalid UTF-8: unexpected end of data", 6),
+    ],
+)
+def test_iter_json_array_invalid(data, msg, pos):
+    stream = iter_json_array(io.BytesIO(data), TypeAdapter(int), ("body",), 2)
+    with pytest.raises(RequestValidationError) as exc_info:
+        list(stream)
+    (error,) = exc_info.value.errors
+    assert error["type"] == "json_invalid"
+    assert error["ctx"] == {"error": msg}
+    assert error["loc"] == ("body", pos)
+
+
+def test_iter_json_array_empty():
+    assert (
+        list(iter_json_array(io.BytesIO(b" [ ] "), TypeAdapter(int), ("body",))) == []
+    )
+
+
+class CountingStream(io.BytesIO):
+    def __init__(self, data):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def test_iter_json_array_syntax_error_stops_reading():
+    item = b'{"name": "' + b"x" * 100 + b'"}'
+    data = b"[" + item + b', {"name": bad}, ' + b", ".join([item] * 10_000) + b"]"
+    stream = CountingStream(data)
+    with pytest.raises(RequestValidationError) as exc_info:
+        list(iter_json_array(stream, TypeAdapter(object), ("body",), 1024))
+    (error,) = exc_info.value.errors
+    assert error["ctx"] == {"error": "Expecting value"}
+    assert error["loc"] == ("body", len(item) + 12)
+    assert stream.bytes_read <= 2048
+
+
+def test_iter_json_array_long_string_across_reads():
+    value = "é" * 5000
+    data = json.dumps([value, value], ensure_ascii=False).encode()
+    stream = iter_json_array(io.BytesIO(data), TypeAdapter(str), ("body",), 64)
+    assert list(stream) == [value, value]
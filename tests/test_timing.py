@@ -0,0 +1,117 @@
+import logging
+from typing import Annotated, List, Tuple
+
+import pytest
+from flask import Flask, jsonify
+from pydantic import BaseModel
+
+from flask_request_data_validator import (
+    LoggingTimingSink,
+    Path,
+    Query,
+    TimingStats,
+    parameter_validator,
+    set_timing_sink,
+)
+
+app = Flask(__name__)
+client = app.test_client()
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+@app.post("/items/<item_id>")
+@parameter_validator
+def create_item(item_id: Annotated[int, Path()], item: Item):
+    return jsonify({"item_id": item_id, "item": item.model_dump()})
+
+
+@app.get("/items")
+@parameter_validator(combined_validation=True)
+def read_items(q: Annotated[str, Query()]):
+    return jsonify({"q": q})
+
+
+records: List[Tuple[str, str, float]] = []
+
+
+@app.get("/users/<user_id>")
+@parameter_validator(timing_sink=lambda *record: records.append(record))
+def read_user(user_id: Annotated[int, Path()]):
+    return jsonify({"user_id": user_id})
+
+
+@pytest.fixture
+def stats():
+    stats = TimingStats()
+    set_timing_sink(stats)
+    yield stats
+    set_timing_sink(None)
+
+
+def test_records_phases(stats):
+    response = client.post("/items/1", json={"name": "Foo", "price": 1.5})
+    assert response.status_code == 200
+    snapshot = stats.snapshot()
+    assert set(snapshot["create_item"]) == {
+        "path",
+        "body_read",
+        "body_validation",
+        "view",
+    }
+    for phase in snapshot["create_item"].values():
+        assert phase["count"] == 1
+        assert phase["total"] >= 0
+
+
+def test_records_legacy_body_path(stats):
+    response = client.post(
+        "/items/1", data=b"{", headers={"Content-Type": "application/json"}
+    )
+    assert response.status_code == 422
+    assert set(stats.snapshot()["create_item"]) == {
+        "path",
+        "body_read",
+        "body_validation",
+        "json_parse",
+        "error_handling",
+    }
+
+
+def test_records_combined_validation(stats):
+    client.get("/items?q=a")
+    client.get("/items")
+    phases = stats.snapshot()["read_items"]
+    assert set(phases) == {"query", "validation", "view", "error_handling"}
+    assert phases["query"]["count"] == 2
+    assert phases["validation"]["count"] == 1
+    assert stats.get("read_items", "view").count == 1
+
+
+def test_reset(stats):
+    client.get("/items?q=a")
+    stats.reset()
+    assert stats.snapshot() == {}
+
+
+def test_route_sink_overrides_global(stats):
+    records.clear()
+    client.get("/users/1")
+    assert [phase for _, phase, _ in records] == ["path", "view"]
+    assert all(endpoint == "read_user" for endpoint, _, _ in records)
+    assert "read_user" not in stats.snapshot()
+
+
+def test_logging_sink(caplog):
+    set_timing_sink(LoggingTimingSink())
+    try:
+        with caplog.at_level(logging.DEBUG, logger="flask_request_data_validator"):
+            client.get("/items?q=a")
+    finally:
+        set_timing_sink(None)
+    messages = [record.getMessage() for record in caplog.records]
+    assert any(message.startswith("read_items query ") for message in messages)
+    assert any(message.startswith("read_items view ") for message in messages)
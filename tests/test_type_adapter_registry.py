@@ -0,0 +1,71 @@
+from typing import Annotated
+
+from flask import Flask, jsonify
+
+from flask_request_data_validator import (
+    Query,
+    parameter_validator,
+    type_adapter_registry,
+)
+
+app = Flask(__name__)
+client = app.test_client()
+
+
+@app.get("/users")
+@parameter_validator
+def read_users(page: Annotated[int, Query(ge=1)] = 1):
+    return jsonify({"page": page})
+
+
+@app.get("/items")
+@parameter_validator
+def read_items(
+    page: Annotated[int, Query(ge=1)] = 2,
+    size: Annotated[int, Query(ge=1, le=100)] = 10,
+):
+    return jsonify({"page": page, "size": size})
+
+
+def test_identical_fields_share_type_adapter():
+    users_page = read_users.dependant.query_params["page"]
+    items_page = read_items.dependant.query_params["page"]
+    items_size = read_items.dependant.query_params["size"]
+    assert users_page.type_adapter is items_page.type_adapter
+    assert items_page.type_adapter is not items_size.type_adapter
+
+
+def test_shared_type_adapter_keeps_field_defaults():
+    assert client.get("/users").get_json() == {"page": 1}
+    assert client.get("/items").get_json() == {"page": 2, "size": 10}
+    assert client.get("/items?page=0").status_code == 422
+    assert client.get("/items?size=101").status_code == 422
+
+
+def test_registry_reports_hits():
+    hits, misses, size = type_adapter_registry.info()
+
+    @parameter_validator
+    def view(page: Annotated[int, Query(ge=1)] = 1):
+        return page
+
+    view.warmup()
+    info = type_adapter_registry.info()
+    assert info.hits > hits
+    assert info.misses >= misses
+    assert info.size >= size
+
+
+def test_type_adapter_is_built_once_on_warmup():
+    @parameter_validator
+    def view(limit: Annotated[int, Query(ge=1, le=12345)] = 1):
+        return limit
+
+    field = view.dependant.query_params["limit"]
+    assert field._type_adapter is None
+    misses = type_adapter_registry.info().misses
+    view.warmup()
+    adapter = field.type_adapter
+    view.warmup()
+    assert field.type_adapter is adapter
+    assert type_adapter_registry.info().misses == misses + 1
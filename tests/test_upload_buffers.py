@@ -0,0 +1,95 @@
+import hashlib
+import io
+import mmap
+from typing import Annotated
+
+import pytest
+from flask import Flask, jsonify
+from werkzeug.datastructures import FileStorage
+
+from flask_request_data_validator import File, UploadedFile, parameter_validator
+from flask_request_data_validator.multipart import UploadSpool
+
+app = Flask(__name__)
+client = app.test_client()
+
+
+@app.post("/upload")
+@parameter_validator(spool_threshold=64)
+def upload(file: Annotated[UploadedFile, File()]):
+    view = file.memoryview()
+    result = {
+        "in_memory": file.in_memory,
+        "readonly": view.readonly,
+        "sha256": hashlib.sha256(view).hexdigest(),
+        "position": file.stream.tell(),
+    }
+    if not file.in_memory and file.size:
+        with file.mmap() as mapped:
+            result["mmap"] = hashlib.sha256(mapped).hexdigest()
+    else:
+        with pytest.raises(ValueError):
+            file.mmap()
+    view.release()
+    with file.buffer() as view:
+        result["buffer"] = hashlib.sha256(view).hexdigest()
+    return jsonify(result)
+
+
+@pytest.mark.parametrize(
+    "data,in_memory",
+    [
+        (b"", True),
+        (b"small", True),
+        (b"x" * 65, False),
+        (bytes(range(256)) * 64, False),
+    ],
+)
+def test_memoryview(data, in_memory):
+    response = client.post(
+        "/upload", data={"file": FileStorage(io.BytesIO(data), "f.bin")}
+    )
+    assert response.status_code == 200, response.text
+    body = response.get_json()
+    digest = hashlib.sha256(data).hexdigest()
+    assert body["in_memory"] is in_memory
+    assert body["readonly"] is True
+    assert body["sha256"] == digest
+    assert body["position"] == 0
+    assert body["buffer"] == digest
+    if not in_memory:
+        assert body["mmap"] == digest
+
+
+def test_mmap_is_read_only():
+    spool = UploadSpool(4)
+    spool.write(b"abcdefgh")
+    spool.seek(0)
+    with UploadedFile(spool, "f.bin").mmap() as mapped:
+        assert mapped[:] == b"abcdefgh"
+        with pytest.raises(TypeError):
+            mapped[0:1] = b"z"
+    assert isinstance(mapped, mmap.mmap)
+
+
+@pytest.mark.parametrize("data", [b"", b"abc", b"abcdefgh"])
+def test_buffer_is_released(data):
+    spool = UploadSpool(4)
+    spool.write(data)
+    spool.seek(0)
+    with UploadedFile(spool, "f.bin").buffer() as view:
+        assert view.readonly
+        assert view.tobytes() == data
+    with pytest.raises(ValueError):
+        view.tobytes()
+    spool.close()
+
+
+def test_unreleased_memoryview_blocks_close():
+    spool = UploadSpool(16)
+    spool.write(b"abc")
+    view = UploadedFile(spool, "f.bin").memoryview()
+    with pytest.raises(BufferError):
+        spool.close()
+    view.release()
+    spool.close()
@@ -0,0 +1,82 @@
+import hashlib
+import io
+import zlib
+from typing import Annotated, List
+
+import pytest
+from flask import Flask, jsonify
+from werkzeug.datastructures import FileStorage
+
+from flask_request_data_validator import File, UploadedFile, parameter_validator
+
+app = Flask(__name__)
+client = app.test_client()
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 100
+
+
+@app.post("/upload")
+@parameter_validator(spool_threshold=64)
+def upload(
+    file: Annotated[FileStorage, File(digests=["SHA256", "md5", "crc32"], sniff=True)],
+):
+    assert isinstance(file, UploadedFile)
+    return jsonify(
+        {
+            "digests": file.digests,
+            "sniffed_type": file.sniffed_type,
+            "size": file.size,
+            "content": file.read().hex(),
+        }
+    )
+
+
+@app.post("/uploads")
+@parameter_validator
+def uploads(files: Annotated[List[FileStorage], File(sniff=True)]):
+    return jsonify([[file.sniffed_type, file.digests] for file in files])
+
+
+@pytest.mark.parametrize("data", [b"", b"hello", PNG, b"x" * 100_000])
+def test_digests(data):
+    response = client.post(
+        "/upload", data={"file": FileStorage(io.BytesIO(data), "f.bin")}
+    )
+    assert response.status_code == 200, response.text
+    body = response.get_json()
+    assert body["digests"] == {
+        "SHA256": hashlib.sha256(data).hexdigest(),
+        "md5": hashlib.md5(data).hexdigest(),
+        "crc32": f"{zlib.crc32(data):08x}",
+    }
+    assert body["size"] == len(data)
+    assert body["content"] == data.hex()
+
+
+def test_sniffed_type():
+    response = client.post(
+        "/uploads",
+        data={
+            "files": [
+                FileStorage(io.BytesIO(PNG), "a.txt", content_type="text/plain"),
+                FileStorage(io.BytesIO(b"%PDF-1.7 ..."), "b.pdf"),
+                FileStorage(io.BytesIO(b"RIFF\x00\x00\x00\x00WEBPVP8 "), "c"),
+                FileStorage(io.BytesIO(b"plain text"), "d.txt"),
+                FileStorage(io.BytesIO(b""), "e"),
+            ]
+        },
+    )
+    assert response.status_code == 200, response.text
+    assert response.get_json() == [
+        ["image/png", {}],
+        ["application/pdf", {}],
+        ["image/webp", {}],
+        [None, {}],
+        [None, {}],
+    ]
+
+
+@pytest.mark.parametrize("name", ["nope", "shake_128", "shake_256"])
+def test_unsupported_digest(name):
+    with pytest.raises(ValueError):
+        File(digests=[name])
@@ -0,0 +1,55 @@
+import gc
+from functools import wraps
+from typing import Annotated
+
+from flask import Flask, jsonify
+
+from flask_request_data_validator import Query, parameter_validator, warmup
+
+app = Flask(__name__)
+client = app.test_client()
+
+
+def logged(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+@app.get("/items")
+@parameter_validator
+def read_items(limit: Annotated[int, Query(ge=1, le=54321)] = 10):
+    return jsonify({"limit": limit})
+
+
+@app.get("/users")
+@logged
+@parameter_validator
+def read_users(page: Annotated[int, Query(ge=1, le=65432)] = 1):
+    return jsonify({"page": page})
+
+
+@app.get("/health")
+def health():
+    return "ok"
+
+
+def test_warmup_builds_every_decorated_view():
+    fields = [
+        read_items.dependant.query_params["limit"],
+        read_users.__wrapped__.dependant.query_params["page"],
+    ]
+    assert all(field._type_adapter is None for field in fields)
+    assert warmup(app) == 2
+    assert all(field._type_adapter is not None for field in fields)
+    assert client.get("/users?page=2").get_json() == {"page": 2}
+
+
+def test_warmup_freeze():
+    try:
+        warmup(app, freeze=True)
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()